@@ -1,22 +1,67 @@
 import asyncio
+import contextvars
 import inspect
+import itertools
+import sys
+import weakref
 from collections import defaultdict as dd
-from pydantic import BaseModel, field_validator
-from typing import Any, Callable, Optional, TYPE_CHECKING
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import field
+from pydantic import ConfigDict, Field, field_validator
+from pydantic.dataclasses import dataclass
+from weakref import WeakMethod
+from typing import (Any, Callable, Hashable, Iterable, Iterator, Optional, 
+                    TYPE_CHECKING)
 from .consts import DEFAULT_CHANNEL, DEFAULT_EVENT_TYPE, FORBIDDEN_CHARACTERS
 from .event import Event, SourceInfo
-from .utils import type_check, validate_forbidden_characters
+from .utils import validate_forbidden_characters
 
 
 if TYPE_CHECKING:
     from .relay import Relay
 
+# source of unique, monotonically increasing binding tokens
+_tokens = itertools.count(1)
 
-class Binding(BaseModel):
+# bindings are validated like pydantic models but stored in slots, and are 
+# frozen since the registry indexes them by their fields. Every subclass 
+# must be decorated too, otherwise its instances get a `__dict__` again
+_binding_dataclass = dataclass(slots=True, frozen=True, eq=False, 
+                               config=ConfigDict(populate_by_name=True))
+
+
+@_binding_dataclass
+class Binding:
     """ Base class for event bindings. """
-    method:Callable[..., Any] = ...
+
+    # passed in as `method`. Bound methods are stored as a `WeakMethod` so 
+    # that a binding doesn't keep its relay alive; read it through `method`
+    method_ref:Callable[..., Any] = Field(..., alias='method')
     event_type:Optional[str] = DEFAULT_EVENT_TYPE
     channel:Optional[str] = DEFAULT_CHANNEL
+    _token:int = field(default_factory=_tokens.__next__, init=False, 
+                       repr=False)
+
+    @property
+    def method(self) -> Callable[..., Any]|None:
+        """ the bound method (or function), None if its relay is gone """
+        ref = self.method_ref
+        return ref() if isinstance(ref, WeakMethod) else ref
+
+    @property
+    def token(self) -> int:
+        """ unique id of this binding instance (shared by its copies) """
+        return self._token
+
+    def __eq__(self, other:Any) -> bool:
+        # a binding and its copies share a token, which is all the registry 
+        # goes by, so there's no need to compare every field
+        return self is other or (type(other) is type(self) 
+                                 and self._token == other._token)
+
+    def __hash__(self) -> int:
+        return hash(self._token)
 
     @field_validator('channel', 'event_type', mode="before")
     def _check_forbidden_characters(cls, v:str) -> str:
@@ -29,20 +74,29 @@ class Binding(BaseModel):
             
         Returns:
         -------
-            The original value if no forbidden characters are found.
+            The original value if no forbidden characters are found, 
+            interned if it's a string so that dispatch lookups keyed on 
+            (channel, event_type) can match keys by identity.
         """
-        return validate_forbidden_characters(v, FORBIDDEN_CHARACTERS)
+        v = validate_forbidden_characters(v, FORBIDDEN_CHARACTERS)
+        return sys.intern(v) if type(v) is str else v
     
-    @field_validator('method', mode="after")
+    @field_validator('method_ref', mode="after")
     def _check_async(cls, func:Callable[..., Any]) -> Callable[..., Any]:
         if not asyncio.iscoroutinefunction(func):
             raise TypeError(
                 f"The method must be asynchronous. Your method "
                 f"'{func.__name__}' is synchronous. The Binding only "
                 "supports asynchronous methods.")
+        if inspect.ismethod(func):
+            try:
+                return WeakMethod(func)
+            except TypeError:  # instance doesn't support weak references
+                pass
         return func
 
 
+@_binding_dataclass
 class Listener(Binding):
     """
     A derived class from `Binding` that represents an event listener.
@@ -57,6 +111,13 @@ class Listener(Binding):
     `source` (Optional[SourceInfo]): Represents the source of the event. 
     It can be an instance of `SourceInfo`, used to provide additional 
     information about the source of the event. Default is `None`.
+
+    `shared_context` (bool): If True, the listener runs in a `contextvars` 
+    context captured once when the binding is created, instead of a fresh 
+    copy of the emitter's context for every event. This saves a context 
+    copy per dispatch, but all of the listener's runs share that context, 
+    so values it sets on context variables are seen by its later runs. 
+    Requires Python 3.11+. Default is `False`.
     
     Inherited Class Attributes:
     --------------------------
@@ -77,8 +138,27 @@ class Listener(Binding):
     """
     # TODO: docstring. use class level method for config
     source:Optional[SourceInfo] = None
+    shared_context:bool = False
+    # Optional[contextvars.Context], which pydantic has no schema for
+    _context:Any = field(default=None, init=False, repr=False)
 
+    @field_validator('shared_context', mode="after")
+    def _check_shared_context(cls, shared:bool) -> bool:
+        if shared and sys.version_info < (3, 11):
+            raise ValueError("shared_context requires Python 3.11 or newer.")
+        return shared
 
+    def __post_init__(self):
+        if self.shared_context:
+            object.__setattr__(self, '_context', contextvars.copy_context())
+
+    @property
+    def context(self) -> Optional[contextvars.Context]:
+        """ the context the listener runs in, None for the emitter's """
+        return self._context
+
+
+@_binding_dataclass
 class Emitter(Binding):
     """
     A class to represent event emission bindings.
@@ -118,6 +198,72 @@ class Emitter(Binding):
     # TODO: docstring. use class level method for config
 
 
+def _method_key(method:Callable[..., Any]) -> Hashable:
+    """ identity key of a (bound) method that doesn't reference its instance """
+    if inspect.ismethod(method):
+        return id(method.__self__), method.__func__
+    return method
+
+
+class _IdentityIndex:
+    """
+    Maps objects to lists of bindings by identity instead of equality, 
+    without keeping the objects alive: `key` turns an object into its 
+    identity key (e.g. `id`) and `data` holds the `{key: list}` dict. 
+    Reading a missing object returns an empty tuple.
+    """
+    __slots__ = ('data', 'key')
+
+    def __init__(self, key:Callable[[Any], Hashable]):
+        self.data:dict[Hashable, list[Binding]] = {}
+        self.key = key
+
+    def __getitem__(self, obj:Any) -> list[Binding]|tuple:
+        return self.data.get(self.key(obj), ())
+
+    def __contains__(self, obj:Any) -> bool:
+        return self.key(obj) in self.data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def get(self, obj:Any, default:Any=None) -> list[Binding]|Any:
+        return self.data.get(self.key(obj), default)
+
+    def clear(self):
+        self.data.clear()
+
+
+class _Registry:
+    """
+    The binding indexes that `Bindings` operates on. See the `Bindings` 
+    docstring for what each of them holds and `Bindings.scope` for how a 
+    registry is selected.
+    """
+    __slots__ = ('by_chnl_and_type', 'by_relay', 'by_method', 'by_func', 
+                 'by_token', 'listeners', 'finalizers', 'dead_relays')
+
+    def __init__(self):
+        self.by_chnl_and_type:dd[str, dd[str, list[Binding]]] = \
+            dd(lambda: dd(list))
+        self.by_relay:_IdentityIndex = _IdentityIndex(id)
+        self.by_method:_IdentityIndex = _IdentityIndex(_method_key)
+        self.by_func:dict[Callable[..., Any], list[Binding]] = {}
+        self.by_token:dict[int, tuple[Binding, str, str, Hashable, int]] = {}
+        # listeners of (channel, event_type), built on first dispatch and 
+        # dropped whenever that bucket changes, see `Bindings.get_listeners`
+        self.listeners:dict[tuple[str, str], tuple[Listener, ...]] = {}
+        # `weakref.finalize` of every relay with bindings, keyed by `id(relay)`
+        self.finalizers:dict[int, weakref.finalize] = {}
+        # ids of collected relays whose bindings are yet to be dropped
+        self.dead_relays:list[int] = []
+
+
+# the registry `Bindings` uses; the default one is shared by all contexts
+_current_registry:ContextVar[_Registry] = ContextVar('bindings', 
+                                                     default=_Registry())
+
+
 class Bindings:
     """
     A class used to manage event bindings in a structured manner.
@@ -131,36 +277,69 @@ class Bindings:
     3. Method associated with the binding
 
     All bindings are internally managed using three dictionaries:
-    `_by_chnl_and_type`, `_by_relay`, and `_by_method`, each representing 
+    `by_chnl_and_type`, `by_relay`, and `by_method`, each representing 
     bindings by channel and event type, by relay instance, and by associated 
     method respectively. They contain same data indexed differently.
 
-    Class Attributes:
-    ----------------
-    `_by_chnl_and_type`: A nested defaultdict that maps a channel (str) to 
+    These live on a registry held in a `ContextVar` (see `_registry`). By 
+    default all contexts share one registry; `scope()` swaps in an empty 
+    one for the duration of a `with` block.
+
+    Registry Attributes:
+    -------------------
+    `by_chnl_and_type`: A nested defaultdict that maps a channel (str) to 
     another defaultdict, which further maps an event type (str) to a list of 
     Binding instances.
 
-    `_by_relay`: A defaultdict that maps a Relay instance to a list of Binding 
-    instances.
+    `by_relay`: Maps a Relay instance to a list of Binding instances. Keyed
+    by identity (`id(relay)`), so it neither keeps relays alive nor calls 
+    their `__eq__`/`__hash__`.
 
-    `_by_method`: A defaultdict that maps a method (Callable) to a list of 
-    Binding instances.
+    `by_method`: Maps a bound method to a list of Binding instances. Keyed 
+    by `(id(relay), function)` for the same reasons.
+
+    `by_func`: Maps the function underlying bound methods to a list of 
+    Binding instances, across all relays.
+
+    `by_token`: A dict that maps a binding token (int) to the registered 
+    binding and the keys it is indexed under in the other three structures.
+    It is the source of truth for whether a binding is registered.
+
+    Bindings hold their relay weakly (see `Binding.method`), so once a relay 
+    is garbage collected its bindings are dropped from all structures.
 
     Methods:
     -------
     `clear() -> None:`
         Clear all registered bindings.
 
-    `add(binding: Binding) -> None:`
-        Add a new binding to the tracking structures.
+    `scope() -> ContextManager:`
+        Use a new, empty registry within a `with` block.
+
+    `count() -> int:`
+        Number of registered bindings.
+
+    `add(binding: Binding) -> int:`
+        Add a new binding to the tracking structures, returns its token.
+
+    `bulk_add(bindings: Iterable[Binding]) -> None:`
+        Add several bindings to the tracking structures at once.
 
     `remove(binding: Binding) -> None:`
         Remove a specific binding from the tracking structures.
 
+    `bulk_remove(bindings: Iterable[Binding]) -> None:`
+        Remove several bindings from the tracking structures at once.
+
     `remove_relay(relay: 'Relay') -> None:`
         Remove all bindings associated with a specific relay instance.
 
+    `get_by_token(token: int) -> Binding | None:`
+        Retrieve a registered binding by the token returned from `add`.
+
+    `get_listeners(channel: str, event_type: str) -> tuple[Listener, ...]:`
+        Retrieve the listeners to dispatch an event to, cached per key.
+
     `get_by_event(channel: str, event_type: str, filter_: Union[Binding, 
     Listener, Emitter]) -> list[Binding]:`
         Retrieve bindings based on channel and event_type patterns, optionally 
@@ -175,33 +354,83 @@ class Bindings:
     Listener, Emitter]) -> list[Binding]:`
         Retrieve bindings associated with a specific method, 
         optionally filtered by binding type.
+
+    `get_by_function(func: Callable[..., Any], filter_: Union[Binding, 
+    Listener, Emitter]) -> list[Binding]:`
+        Retrieve bindings of a function on any relay instance, 
+        optionally filtered by binding type.
     """
 
-    _by_chnl_and_type:dd[str, dd[str, list[Binding]]] = dd(lambda: dd(list))
-    _by_relay:dd['Relay', list[Binding]] = dd(list)
-    _by_method:dd[Callable[..., Any], list[Binding]] = dd(list)
+    @staticmethod
+    def _registry() -> _Registry:
+        """ the registry of the current context, see `scope` """
+        return _current_registry.get()
+
+    @staticmethod
+    @contextmanager
+    def scope() -> Iterator[None]:
+        """
+        Use a new, empty registry until the `with` block exits.
+
+        The registry is held in a `ContextVar`, so it only applies to the 
+        current context (and tasks created from it), letting e.g. tests or 
+        concurrently running event loops keep their bindings isolated 
+        without having to `clear` a shared registry.
+
+        Usage:
+        -----
+        ```python
+        with Bindings.scope():
+            Bindings.add(binding)  # only visible inside the block
+        ```
+        """
+        token = _current_registry.set(_Registry())
+        try:
+            yield
+        finally:
+            _current_registry.reset(token)
 
     @classmethod
     def clear(cls):
         """ clears all bindings """
-        cls._by_chnl_and_type.clear()
-        cls._by_relay.clear()
-        cls._by_method.clear()
+        reg = cls._registry()
+        reg.by_chnl_and_type.clear()
+        reg.by_relay.clear()
+        reg.by_method.clear()
+        reg.by_func.clear()
+        reg.by_token.clear()
+        reg.listeners.clear()
+        for finalizer in reg.finalizers.values():
+            finalizer.detach()
+        reg.finalizers.clear()
+        reg.dead_relays.clear()
+
+    @classmethod
+    def count(cls) -> int:
+        """ returns the number of registered bindings in O(1) """
+        reg = cls._registry()
+        if reg.dead_relays:
+            cls._drop_dead_relays(reg)
+        return len(reg.by_token)
 
     @classmethod
-    def add(cls, binding:Binding):
+    def add(cls, binding:Binding) -> int:
         """
         Register a new event binding.
 
         This method stores the provided `binding` in internal tracking
         structures. 
-        If the binding already exists, it is ignored. 
+        If the binding (or a copy of it) already exists, it is ignored. 
 
         Parameters:
         ----------
         - `binding` (Binding): The event binding instance to add.
         (`Listener` or `Emitter`)
 
+        Returns:
+        -------
+        - `int`: The binding's token, see `get_by_token`.
+
         Note:
         ----
         Future iterations may introduce static type compatibility checks against
@@ -211,27 +440,74 @@ class Bindings:
         These checks will only be done via `@Relay.emits` and `@Relay.receives`
         decorators inside `Relay` child classes.
         """
-        channel, event_type, method, instance = cls._get_binding_data(binding)
-        
-        b_chnl_and_type = cls._by_chnl_and_type[channel]
-        if binding not in b_chnl_and_type[event_type]:
-            b_chnl_and_type[event_type].append(binding)
+        cls.bulk_add((binding,))
+        return binding.token
 
-        b_relay = cls._by_relay[instance]
-        if binding not in b_relay:
-            b_relay.append(binding)
-        
-        b_func = cls._by_method[method]
-        if binding not in b_func:
-            b_func.append(binding)
+    @classmethod
+    def bulk_add(cls, bindings:Iterable[Binding]):
+        """
+        Register several event bindings at once.
+
+        Equivalent to calling `add` for every binding, but all bindings are 
+        validated before any of them is registered, so an invalid binding 
+        leaves the tracking structures untouched. Prefer this over repeated 
+        `add` calls when registering many bindings (e.g. at startup).
+
+        Parameters:
+        ----------
+        - `bindings` (Iterable[Binding]): The event binding instances to add.
+        (`Listener` or `Emitter`)
+
+        Raises:
+        ------
+        - `ValueError`: If any binding's method is not bound to a Relay.
+        """
+        reg = cls._registry()
+        if reg.dead_relays:
+            cls._drop_dead_relays(reg)
+        by_token = reg.by_token
+        # re-adding a registered binding (or a copy) is a no-op, so it's 
+        # neither validated again nor looked up anywhere but by its token
+        data = [(binding, *cls._get_binding_data(binding)) 
+                for binding in bindings if binding.token not in by_token]
+
+        by_chnl_and_type = reg.by_chnl_and_type
+        by_relay = reg.by_relay.data
+        by_method = reg.by_method.data
+        by_func = reg.by_func
+        listeners = reg.listeners
+        finalizers = reg.finalizers
+        for binding, channel, event_type, method, instance in data:
+            if binding.token in by_token:  # listed more than once
+                continue
+            relay_key = id(instance)
+            method_key = (relay_key, method.__func__)
+            # keep the keys so `remove` doesn't have to recompute them
+            by_token[binding.token] = (binding, channel, event_type, 
+                                       method_key, relay_key)
+            by_method.setdefault(method_key, []).append(binding)
+            by_func.setdefault(method.__func__, []).append(binding)
+            by_chnl_and_type[channel][event_type].append(binding)
+            by_relay.setdefault(relay_key, []).append(binding)
+            listeners.pop((channel, event_type), None)
+
+            if relay_key not in finalizers:
+                try:
+                    finalizer = weakref.finalize(
+                        instance, reg.dead_relays.append, relay_key)
+                except TypeError:  # relay doesn't support weak references
+                    pass
+                else:
+                    finalizer.atexit = False
+                    finalizers[relay_key] = finalizer
 
     @classmethod
     def remove(cls, binding:Binding):
         """
         Remove a specified binding from internal tracking structures.
         
-        This method cleans the binding references from `_by_chnl_and_type`,
-        `_by_relay`, and `_by_method`. Additionally, it handles cleanup 
+        This method cleans the binding references from `by_chnl_and_type`,
+        `by_relay`, and `by_method`. Additionally, it handles cleanup 
         of any empty nested dictionaries within these structures.
 
         Parameters:
@@ -245,54 +521,161 @@ class Bindings:
         """
         if binding is None:
             return
-        
-        channel, event_type, func, instance = cls._get_binding_data(binding)
-        
-        # Working with _by_chnl_and_type
-        if binding in cls._by_chnl_and_type[channel].get(event_type, []):
-            cls._by_chnl_and_type[channel][event_type].remove(binding)
+        cls.bulk_remove((binding,))
 
-        # Removing empty event type
-        if not cls._by_chnl_and_type[channel].get(event_type):
-            try:
-                del cls._by_chnl_and_type[channel][event_type]
-            except KeyError: pass
+    @classmethod
+    def bulk_remove(cls, bindings:Iterable[Binding]):
+        """
+        Remove several bindings at once.
 
-        # Removing empty channel
-        if not cls._by_chnl_and_type[channel]:
-            try:
-                del cls._by_chnl_and_type[channel]
-            except KeyError: pass
+        Equivalent to calling `remove` for every binding, but empty 
+        containers are pruned once at the end instead of after every 
+        removal. `None` entries and bindings that were never added are 
+        ignored.
 
-        # Working with _by_relay
-        if binding in cls._by_relay.get(instance, []):
-            cls._by_relay[instance].remove(binding)
-            
-        # Removing empty relay
-        if not cls._by_relay.get(instance):
-            try:
-                del cls._by_relay[instance]
-            except KeyError: pass
+        Parameters:
+        ----------
+        - `bindings` (Iterable[Binding]): The binding instances to be removed.
 
-        # Working with _by_function
-        if binding in cls._by_method.get(func, []):
-            cls._by_method[func].remove(binding)
-            
-        # Removing empty function
-        if not cls._by_method.get(func):
-            try:
-                del cls._by_method[func]
-            except KeyError: pass
+        Raises:
+        ------
+        - `ValueError`: If any binding's method is not bound to a Relay. 
+        Nothing is removed in that case.
+        """
+        bindings = [binding for binding in bindings if binding is not None]
+        reg = cls._registry()
+        # validate first so unbound methods raise even on an empty registry.
+        # Registered bindings were validated by `add`, and bindings whose 
+        # relay is gone can't be registered, so both are skipped.
+        for binding in bindings:
+            if (binding.token not in reg.by_token 
+                and binding.method is not None):
+                cls._get_binding_data(binding)
+        if reg.dead_relays:
+            cls._drop_dead_relays(reg)
+        cls._unregister(reg, bindings)
+
+    @classmethod
+    def _unregister(cls, reg:_Registry, bindings:Iterable[Binding]):
+        """ removes the registered ones of the given (validated) bindings """
+        by_chnl_and_type = reg.by_chnl_and_type
+        by_relay = reg.by_relay.data
+        by_method = reg.by_method.data
+        by_token = reg.by_token
+        listeners = reg.listeners
+        touched = []
+        for binding in bindings:
+            record = by_token.pop(binding.token, None)
+            if record is None:  # not registered
+                continue
+            _, channel, event_type, method_key, relay_key = record
+            by_method[method_key].remove(binding)
+            reg.by_func[method_key[1]].remove(binding)
+            by_chnl_and_type[channel][event_type].remove(binding)
+            by_relay[relay_key].remove(binding)
+            listeners.pop((channel, event_type), None)
+            touched.append(record)
+        cls._prune(reg, touched)
+
+    @classmethod
+    def _prune(cls, reg:_Registry, 
+               records:Iterable[tuple[Binding, str, str, Hashable, int]]):
+        """ deletes the records' keys whose containers have become empty """
+        by_relay = reg.by_relay.data
+        by_method = reg.by_method.data
+        for _, channel, event_type, method_key, relay_key in records:
+            by_type = reg.by_chnl_and_type.get(channel)
+            if by_type is not None:
+                if not by_type.get(event_type, True):
+                    del by_type[event_type]
+                if not by_type:
+                    del reg.by_chnl_and_type[channel]
+            if not by_method.get(method_key, True):
+                del by_method[method_key]
+            if not reg.by_func.get(method_key[1], True):
+                del reg.by_func[method_key[1]]
+            if not by_relay.get(relay_key, True):
+                del by_relay[relay_key]
+                finalizer = reg.finalizers.pop(relay_key, None)
+                if finalizer is not None:
+                    finalizer.detach()
+
+    @classmethod
+    def _drop_dead_relays(cls, reg:_Registry):
+        """ 
+        Unregisters the bindings of relays that were garbage collected. 
+
+        `weakref.finalize` callbacks may run in the middle of any operation 
+        (e.g. a `gc` pass while iterating over the bindings), so they only 
+        queue the relay's id and every public method drops them here first.
+        """
+        dead = reg.dead_relays
+        while dead:
+            bindings = reg.by_relay.data.get(dead.pop())
+            if bindings:
+                cls._unregister(reg, list(bindings))
 
     @classmethod
     def remove_relay(cls, relay:'Relay'):
         """ removes all bindings associated with the relay """
         if relay is None:
             return
-        if relay in cls._by_relay:
-            bindings_to_remove = cls._by_relay[relay]
-            for binding in bindings_to_remove:
-                cls.remove(binding)
+        reg = cls._registry()
+        if reg.dead_relays:
+            cls._drop_dead_relays(reg)
+        bindings_to_remove = reg.by_relay.get(relay)
+        if not bindings_to_remove:
+            return
+        # copy, since removing mutates the list we would be iterating over
+        cls._unregister(reg, list(bindings_to_remove))
+
+    @classmethod
+    def get_by_token(cls, token:int) -> Binding|None:
+        """ returns the registered binding with the given token, if any """
+        reg = cls._registry()
+        if reg.dead_relays:
+            cls._drop_dead_relays(reg)
+        record = reg.by_token.get(token)
+        return None if record is None else record[0]
+
+    @classmethod
+    def get_listeners(cls, channel:str, event_type:str) -> tuple[Listener, ...]:
+        """
+        Return the listeners to dispatch an event of `channel`/`event_type` to.
+
+        Same as `get_by_event(channel, event_type, filter_=Listener)`, but 
+        for specific (non-pattern) keys the result is built once and reused 
+        until a binding of that channel/event_type is added or removed, 
+        instead of copying the bindings on every call. The tuple is shared, 
+        which is safe since bindings added or removed while it's being 
+        iterated over only affect the next call.
+
+        Parameters:
+        ----------
+        - `channel` (str): The channel (pattern) of the event.
+        - `event_type` (str): The event type (pattern) of the event.
+
+        Returns:
+        -------
+        - `tuple[Listener, ...]`: The matching listeners.
+        """
+        reg = cls._registry()
+        if reg.dead_relays:
+            cls._drop_dead_relays(reg)
+        key = (channel, event_type)
+        listeners = reg.listeners.get(key)
+        if listeners is not None:
+            return listeners
+        if '*' in channel or '*' in event_type:
+            return tuple(cls.get_by_event(channel, event_type, Listener))
+
+        by_type = reg.by_chnl_and_type.get(channel)
+        bindings = by_type.get(event_type) if by_type else None
+        if not bindings:  # don't cache keys nothing is bound to
+            return ()
+        listeners = tuple(b for b in bindings if isinstance(b, Listener))
+        reg.listeners[key] = listeners
+        return listeners
 
     @classmethod
     def get_by_event(cls, 
@@ -332,68 +715,118 @@ class Bindings:
         expected types.
         """
 
-        def _matches_pattern(s: str, pattern: str) -> bool:
-            """Check if `s` matches the given pattern."""
-            segments = pattern.split('*')
-            
-            # Check the first segment with startswith and the last segment 
-            # with endswith for optimization
-            if segments[0] and not s.startswith(segments[0]):
-                return False
-            if segments[-1] and not s.endswith(segments[-1]):
-                return False
-            
-            start_idx = 0
-            for segment in segments:
-                # Find the current segment in the string starting from the 
-                # last found index
-                idx = s.find(segment, start_idx)
-                if idx == -1:
-                    return False
-                # Move the pointer beyond the current found segment
-                start_idx = idx + len(segment)
-            
-            return True
-
-        def _retrieve_by_event(channel, event_type):
-            # Base case: If both channel and event_type are specific
-            # (non-wildcards and without pattern)
-            if '*' not in channel and '*' not in event_type:
-                return cls._by_chnl_and_type[channel][event_type]
-            
-            bindings = []
-
-            # If the channel has a wildcard or pattern
-            if '*' in channel:
-                for ch in cls._by_chnl_and_type.keys():
-                    if _matches_pattern(ch, channel):
-                        bindings.extend(_retrieve_by_event(ch, event_type))
-            # If the event_type has a wildcard or pattern
+        reg = cls._registry()
+        if reg.dead_relays:
+            cls._drop_dead_relays(reg)
+        by_chnl_and_type = reg.by_chnl_and_type
+        matches = cls._matches_pattern
+
+        # Base case: both channel and event_type are specific (no pattern).
+        # Use `.get` so lookups of unknown keys don't insert empty entries.
+        if '*' not in channel and '*' not in event_type:
+            by_type = by_chnl_and_type.get(channel)
+            all_bindings = by_type.get(event_type, ()) if by_type else ()
+            return cls._filter(all_bindings, filter_)
+
+        if channel == '*':
+            by_types = list(by_chnl_and_type.values())
+        elif '*' in channel:
+            by_types = [by_type for ch, by_type in by_chnl_and_type.items() 
+                        if matches(ch, channel)]
+        else:
+            by_type = by_chnl_and_type.get(channel)
+            by_types = [by_type] if by_type else []
+
+        all_bindings = []
+        for by_type in by_types:
+            if event_type == '*':
+                for bindings in by_type.values():
+                    all_bindings.extend(bindings)
             elif '*' in event_type:
-                for et in cls._by_chnl_and_type[channel].keys():
-                    if _matches_pattern(et, event_type):
-                        bindings.extend(_retrieve_by_event(channel, et))
-            
-            return bindings
+                for et, bindings in by_type.items():
+                    if matches(et, event_type):
+                        all_bindings.extend(bindings)
+            else:
+                all_bindings.extend(by_type.get(event_type, ()))
 
-        all_bindings = _retrieve_by_event(channel, event_type)
-
-        # Filter based on the given filter.
-        return [b for b in all_bindings if type_check(b, filter_)]
+        return cls._filter(all_bindings, filter_)
 
     @classmethod
     def get_by_relay(cls, 
                      relay:'Relay', 
                      filter_:Binding|Listener|Emitter=Binding
     ) -> list[Binding]:
-        return [b for b in cls._by_relay[relay] if type_check(b, filter_)]
+        reg = cls._registry()
+        if reg.dead_relays:
+            cls._drop_dead_relays(reg)
+        return cls._filter(reg.by_relay.get(relay, ()), filter_)
     
     @classmethod
     def get_by_method(cls, 
                       method:Callable[..., Any],
                       filter_:Binding|Listener|Emitter=Binding
     ) -> list[Binding]:
-        return [b for b in cls._by_method[method] if type_check(b, filter_)]
+        reg = cls._registry()
+        if reg.dead_relays:
+            cls._drop_dead_relays(reg)
+        return cls._filter(reg.by_method.get(method, ()), filter_)
+
+    @classmethod
+    def get_by_function(cls, 
+                        func:Callable[..., Any],
+                        filter_:Binding|Listener|Emitter=Binding
+    ) -> list[Binding]:
+        """
+        Retrieve the bindings of a function, whichever relay it's bound to.
+
+        Parameters:
+        ----------
+        - `func` (Callable[..., Any]): The function (e.g. `MyRelay.listener`) 
+        or any bound method of it (e.g. `my_relay.listener`).
+        - `filter_` (Union[`Binding`, `Listener`, `Emitter`], optional): Filter 
+        the results based on a particular binding type. Default is `Binding`.
+
+        Returns:
+        -------
+        - `list[Binding]`: The bindings of `func` on all relay instances.
+        """
+        reg = cls._registry()
+        if reg.dead_relays:
+            cls._drop_dead_relays(reg)
+        func = getattr(func, '__func__', func)
+        return cls._filter(reg.by_func.get(func, ()), filter_)
+
+    @staticmethod
+    def _filter(bindings:Iterable[Binding],
+                filter_:Binding|Listener|Emitter) -> list[Binding]:
+        """ returns a new list of the bindings that are instances of filter_ """
+        if filter_ is Binding:
+            return list(bindings)
+        return [b for b in bindings if isinstance(b, filter_)]
+
+    @staticmethod
+    def _matches_pattern(s: str, pattern: str) -> bool:
+        """Check if `s` matches the given pattern."""
+        segments = pattern.split('*')
+        
+        # Check the first segment with startswith and the last segment 
+        # with endswith for optimization
+        if segments[0] and not s.startswith(segments[0]):
+            return False
+        if segments[-1] and not s.endswith(segments[-1]):
+            return False
+        
+        start_idx = 0
+        for segment in segments:
+            # Find the current segment in the string starting from the 
+            # last found index
+            idx = s.find(segment, start_idx)
+            if idx == -1:
+                return False
+            # Move the pointer beyond the current found segment
+            start_idx = idx + len(segment)
+        
+        return True
 
     @staticmethod
     def _get_binding_data(binding:Binding):
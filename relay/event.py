@@ -1,6 +1,10 @@
 from __future__ import annotations
-from pydantic import BaseModel, Field, field_validator
-from time import time
+import math
+import sys
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from time import perf_counter, time
 from typing import (Any, Callable, Generic, NamedTuple, 
                     Optional, TYPE_CHECKING, TypeVar)
 from .consts import DEFAULT_CHANNEL, DEFAULT_EVENT_TYPE, FORBIDDEN_CHARACTERS
@@ -10,17 +14,69 @@ from .utils import truncate, validate_forbidden_characters
 if TYPE_CHECKING:
     from .relay import Relay
 else:
-    Relay = Any  # this is a hack but BaseModel won't validate anymore...
+    Relay = Any  # a hack so pydantic can resolve `SourceInfo` in bindings...
 
 
-class SourceInfo(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SourceInfo:
     relay: Optional["Relay"] = None
     emitter: Optional[Callable] = None
 
+    def __post_init__(self):
+        if self.emitter is not None and not callable(self.emitter):
+            raise ValueError(f"SourceInfo emitter must be callable, got "
+                             f"{self.emitter!r}.")
+
+
+_PERF_COUNTER = perf_counter
+# add to an event's monotonic `time` to recover the wall clock (`wall_time`)
+_BOOT_WALL_OFFSET = time() - _PERF_COUNTER()
+_last_timestamp = 0.0
+_timestamp_lock = threading.Lock()
+
+def _timestamp() -> float:
+    """
+    Return a strictly increasing monotonic timestamp for a new event.
+
+    Two events created within the same counter tick are split by nudging the
+    later one to the next representable float, so timestamps stay unique,
+    also across threads.
+    """
+    global _last_timestamp
+    with _timestamp_lock:
+        now = _PERF_COUNTER()
+        if now <= _last_timestamp:
+            now = math.nextafter(_last_timestamp, math.inf)
+        _last_timestamp = now
+    return now
+
+def _check_name(value:str, name:str) -> str:
+    """
+    Validate an event's `channel` or `event_type`.
+
+    Raises:
+    ------
+        ValueError: If the value isn't a string or contains forbidden
+        characters.
+
+    Returns:
+    -------
+        The value, interned so that dispatch lookups keyed on
+        (channel, event_type) can match keys by identity.
+    """
+    validate_forbidden_characters(value, FORBIDDEN_CHARACTERS)
+    if not isinstance(value, str):
+        raise ValueError(f"Event {name} must be a str, got {type(value)}.")
+    return sys.intern(value)
+
+
+# marks `Event.data` as not given; `None` is a valid payload
+_MISSING:Any = object()
 
 T = TypeVar('T', bound=Any)
 
-class Event(Generic[T], BaseModel):
+@dataclass(slots=True)
+class Event(Generic[T]):
     """
     Represents a generic event with data of type `T`.
 
@@ -34,7 +90,8 @@ class Event(Generic[T], BaseModel):
     - `channel (str)`: Communication channel for broadcasting.
     - `event_type (str)`: Type of the event for broadcasting.
     - `source (SourceInfo)`: Origin or source of the event (optional).
-    - `time (float)`: Timestamp when the event was created.
+    - `time (float)`: Monotonic timestamp when the event was created; use it
+      for ordering, and `wall_time` for the wall-clock time.
 
     Constants:
     ---------
@@ -47,6 +104,11 @@ class Event(Generic[T], BaseModel):
     - `channel (str, optional)`: Communication channel. Defaults to 'DEFAULT'.
     - `source (SourceInfo, optional)`: Source of the event. Defaults to None.
 
+    Raises:
+    ------
+    - `ValueError`: If `data` is missing or any of the other arguments is
+    invalid. `data` itself isn't validated, it can be of any type.
+
     Example:
     -------
     ```python
@@ -56,26 +118,70 @@ class Event(Generic[T], BaseModel):
                   source=SourceInfo(relay=my_relay_child, func=my_function))
     ```
     """
-    data: T = ...
+    data: T = _MISSING
     channel: str = DEFAULT_CHANNEL
     event_type: str = DEFAULT_EVENT_TYPE
     source: Optional[SourceInfo] = None
-    time: float = Field(default_factory=time)
-
-    @field_validator('channel', 'event_type', mode="before")
-    def check_forbidden_characters(cls, v:str) -> str:
+    time: float = field(default_factory=_timestamp)
+
+    def __post_init__(self):
+        if self.data is _MISSING:
+            raise ValueError("Event requires `data`.")
+        if self.channel is not DEFAULT_CHANNEL:
+            self.channel = _check_name(self.channel, "channel")
+        if self.event_type is not DEFAULT_EVENT_TYPE:
+            self.event_type = _check_name(self.event_type, "event_type")
+
+        source = self.source
+        if source is not None and type(source) is not SourceInfo:
+            if isinstance(source, Mapping):
+                self.source = SourceInfo(**source)
+            elif not isinstance(source, SourceInfo):
+                raise ValueError(f"Event source must be a SourceInfo, got "
+                                 f"{type(source)}.")
+
+        if type(self.time) is not float:
+            try:
+                self.time = float(self.time)
+            except (TypeError, ValueError):
+                raise ValueError(f"Event time must be a float, got "
+                                 f"{type(self.time)}.") from None
+
+    @classmethod
+    def model_validate(cls, obj:Any) -> Event:
         """
-        Validate if the given value contains forbidden characters.
-        
-        Raises:
-        ------
-            ValueError: If forbidden characters are found in the value.
-            
-        Returns:
-        -------
-            The original value if no forbidden characters are found.
+        Create an event from a mapping of its fields (or return an event as
+        is), for callers written against the pydantic API Event used to have.
+        """
+        if isinstance(obj, cls):
+            return obj
+        if isinstance(obj, Mapping):
+            return cls(**obj)
+        raise ValueError(f"Can't create an Event from {type(obj)}.")
+
+    @classmethod
+    def _unchecked(cls, data:T, channel:str=DEFAULT_CHANNEL,
+                   event_type:str=DEFAULT_EVENT_TYPE,
+                   source:Optional[SourceInfo]=None) -> Event[T]:
+        """
+        Create an event without running validation.
+
+        Only meant for internal callers whose arguments are already known to
+        be valid, e.g. `@Relay.emits`, whose return value has been type
+        checked and whose channel/event_type come from a validated binding.
         """
-        return validate_forbidden_characters(v, FORBIDDEN_CHARACTERS)
+        event = object.__new__(cls)
+        event.data = data
+        event.channel = channel
+        event.event_type = event_type
+        event.source = source
+        event.time = _timestamp()
+        return event
+
+    @property
+    def wall_time(self) -> float:
+        """ The wall-clock time (seconds since the epoch) of the event. """
+        return self.time + _BOOT_WALL_OFFSET
 
     def __str__(self) -> str:
         """
@@ -3,10 +3,10 @@ import inspect
 import functools
 import logging
 from pydantic import BaseModel
-from typing import Any, get_args, get_origin
+from typing import Any, Callable, get_args, get_origin
 from .bindings import Bindings, Listener, Emitter, Binding
 from .event import Event, SourceInfo
-from .utils import type_check, truncate
+from .utils import isinstance_types, type_check, truncate
 
 logging.basicConfig(level=logging.DEBUG,
                     format=('[%(levelname)s] [%(asctime)s] '
@@ -16,6 +16,33 @@ logger = logging.getLogger(__name__)
 RED = "\033[1;31m"; RST = "\033[0;0m"
 
 
+# `Relay.emit` helpers, defined once here rather than on every emit call
+
+def _source_compatible(s_event:SourceInfo, s_listener:SourceInfo) -> bool:
+    """ returns True if event source if compatible with listener
+        source (that is, if listener is expecting an event only
+        from a specific source) 
+    """
+    listn_relay = None if s_listener is None else s_listener.relay
+    listn_emitter = None if s_listener is None else s_listener.emitter
+    event_relay = None if s_event is None else s_event.relay
+    event_emitter = None if s_event is None else s_event.emitter
+
+    if listn_relay != None and event_relay != listn_relay:
+        return False
+    if listn_emitter != None and event_emitter != listn_emitter:
+        return False
+    return True
+
+async def _safe_call(event:Event, method:Callable[[Event], Any]):
+    """ async call the bound method, catch any exceptions """
+    try:
+        await method(event)
+    except Exception as e:
+        logger.exception(f"{RED}Exception in executing emission: {e}. "
+                         f"Event: <{event}>, Method: <{method}>{RST}")
+
+
 class Relay:
 
     class NoEmit(BaseModel):
@@ -86,6 +113,7 @@ class Relay:
         instance of `Emitter` or `Listener`.
         """
         if bindings_config:
+            bindings = []
             for binding in bindings_config:
                 method = getattr(self, binding.method.__name__)
                 if isinstance(binding, Emitter):
@@ -96,10 +124,12 @@ class Relay:
                     _binding = Listener(method=method,
                                         event_type=binding.event_type,
                                         channel=binding.channel,
-                                        source=binding.source)
+                                        source=binding.source,
+                                        shared_context=binding.shared_context)
                 else:
                     raise ValueError(f"Invalid binding type: {type(binding)}")
-                self.add_binding(_binding)
+                bindings.append(_binding)
+            Bindings.bulk_add(bindings)
 
     @classmethod
     async def emit(cls, event:Event):
@@ -153,40 +183,19 @@ class Relay:
         None. However, side effects include calling all the compatible listener 
         methods with the provided event.
         """
-        def source_compatible(s_event:SourceInfo, 
-                              s_listener:SourceInfo) -> bool:
-            """ returns True if event source if compatible with listener
-                source (that is, if listener is expecting an event only
-                from a specific source) 
-            """
-            listn_relay = None if s_listener is None else s_listener.relay
-            listn_emitter = None if s_listener is None else s_listener.emitter
-            event_relay = None if s_event is None else s_event.relay
-            event_emitter = None if s_event is None else s_event.emitter
-
-            if listn_relay != None and event_relay != listn_relay:
-                return False
-            if listn_emitter != None and event_emitter != listn_emitter:
-                return False
-            return True
-
-        async def safe_method(event, method):
-            """ async call the bound method, catch any exceptions """
-            try:
-                result = await method(event)
-            except Exception as e:
-                logger.exception(f"{RED}Exception in executing emission: {e}. "
-                                 f"Event: <{event}>, Method: <{method}>{RST}")
-
-        listeners:list[Listener] = Bindings.get_by_event(event.channel, 
-                                                         event.event_type,
-                                                         filter_=Listener)
+        listeners = Bindings.get_listeners(event.channel, event.event_type)
 
         for listener in listeners:
-            if not source_compatible(event.source, listener.source):
+            if not _source_compatible(event.source, listener.source):
                 continue
             method = listener.method
-            asyncio.create_task(safe_method(event, method))
+            if method is None:  # the listener's relay no longer exists
+                continue
+            context = listener.context
+            if context is None:
+                asyncio.create_task(_safe_call(event, method))
+            else:
+                asyncio.create_task(_safe_call(event, method), context=context)
     
     @classmethod
     def emits(cls, func):
@@ -289,11 +298,19 @@ class Relay:
             method = getattr(self, func.__name__)
             emitters = Bindings.get_by_method(method, filter_=Emitter)
 
+            source = None
             for emitter in emitters:
+                channel, event_type = emitter.channel, emitter.event_type
+                # don't build an event nobody listens to
+                if not Bindings.get_listeners(channel, event_type):
+                    continue
+                if source is None:
+                    source = SourceInfo(relay=self, emitter=method)
+                # the data was type checked above and the channel/event_type 
+                # were validated by the bindings, so skip re-validating them
                 await cls.emit(
-                    Event(data=result, channel=emitter.channel,
-                          event_type=emitter.event_type,
-                          source=SourceInfo(relay=self, emitter=method)))
+                    Event._unchecked(data=result, channel=channel,
+                                     event_type=event_type, source=source))
 
             return result
         return wrapper
@@ -391,6 +408,10 @@ class Relay:
         event_schema:BaseModel = None
         if event_args:  # assumes first annotated argument is the event schema
             event_schema = event_args[0]
+        # plain classes (incl. pydantic models) and unions of them only need
+        # an isinstance check, so resolve that here instead of going through 
+        # `type_check` per call
+        accepts = isinstance_types(event_schema)
         
         @functools.wraps(func)  # preserve func metadata
         async def wrapper(self, event: Event[Any], *args, **kwargs):
@@ -402,7 +423,12 @@ class Relay:
                     "@Relay.receives, must be a method of a class that "
                     "inherits from Relay.")
 
-            if not type_check(event.data, event_schema):
+            data = event.data
+            if accepts is not None:
+                valid = isinstance(data, accepts)
+            else:
+                valid = event_schema is Any or type_check(data, event_schema)
+            if not valid:
                 data_truncated = truncate(event.data, 50)
                 raise TypeError(
                     f"Event data: -> {data_truncated} <- of type "
@@ -1,9 +1,15 @@
+import functools
 from collections import abc
 from pydantic import BaseModel, ValidationError
 from types import UnionType
 from typing import Any, Callable, get_args, get_origin, Literal, Union, TypeVar
 
 
+_ELLIPSIS = "..."
+# ending of a truncated string, by its first character
+_TRUNCATED_ENDS = {opening: _ELLIPSIS + closing for opening, closing 
+                   in (("{", "}"), ("[", "]"), ("(", ")"), ("<", ">"))}
+
 def truncate(data:Any, length:int=20) -> str:
     """
     Truncate the string representation of data if it's longer than the 
@@ -23,17 +29,12 @@ def truncate(data:Any, length:int=20) -> str:
         The truncated string representation of the data.
     """
     data_repr = str(data)
-    matches = {"{": "}", "[": "]", "(": ")", "<": ">"}
-    end = "..."
-    
-    if len(data_repr) > length:
-        # If data starts with an opening brace, update the ending to 
-        # include the matching closing brace.
-        if data_repr[0] in matches:
-            end += matches[data_repr[0]]
-        return f"{data_repr[:length-len(end)]}{end}"
-    else:
+    if len(data_repr) <= length:
         return data_repr
+    # If data starts with an opening brace, the ending also includes the 
+    # matching closing brace.
+    end = _TRUNCATED_ENDS.get(data_repr[0], _ELLIPSIS)
+    return data_repr[:length-len(end)] + end
 
 def type_check(value:Any, type_hint:BaseModel|Any) -> bool:
     """
@@ -95,7 +96,12 @@ def type_check(value:Any, type_hint:BaseModel|Any) -> bool:
         except ValidationError:
             return False
 
-    origin = get_origin(type_hint)
+    # plain classes and unions of them need a single isinstance call
+    classes = _cached_isinstance_types(type_hint)
+    if classes is not None:
+        return isinstance(value, classes)
+
+    origin, args = _origin_args(type_hint)
 
     # for basic types (int, str, etc.) and user-defined classes
     if not origin:
@@ -106,7 +112,6 @@ def type_check(value:Any, type_hint:BaseModel|Any) -> bool:
 
     # Handle List[type] or List[List[type]] and so on
     if origin == list:
-        args = get_args(type_hint)
         # If no type argument is provided for List, accept any list
         if not args:
             return isinstance(value, list)
@@ -122,7 +127,6 @@ def type_check(value:Any, type_hint:BaseModel|Any) -> bool:
    
     # Handle Tuple[type, ...] or Tuple[Tuple[type, ...], ...] and so on
     if origin == tuple:
-        args = get_args(type_hint)
         # If no type arguments are provided for Tuple, accept any tuple
         if not args:
             return isinstance(value, tuple)
@@ -139,30 +143,26 @@ def type_check(value:Any, type_hint:BaseModel|Any) -> bool:
 
     # Handle Set[type] or Set[Set[type]] and so on
     if origin == set:
-        args = get_args(type_hint)
         return (isinstance(value, set) and 
                 all(type_check(item, args[0]) for item in value))
 
     # Handle Dict[key_type, val_type] and so on
     if origin == dict:
-        key_type, val_type = get_args(type_hint)
+        key_type, val_type = args
         return (isinstance(value, dict) and 
                 all(isinstance(k, key_type) and 
                     type_check(v, val_type) for k, v in value.items()))
 
     # Handle Union types (which includes Optional)
     if origin is UnionType or origin is Union:
-        allowed_types = get_args(type_hint)
-        return any(type_check(value, t) for t in allowed_types)
+        return any(type_check(value, t) for t in args)
 
     # Handle Literal types
     if origin == Literal:
-        allowed_values = get_args(type_hint)
-        return value in allowed_values
+        return value in args
 
     # Handle Callable types
     if origin == abc.Callable:
-        args = get_args(type_hint)
         # Check if Callable is parameterized i.e. Callable[[int, str], bool]
         if args == ():
             return callable(value)
@@ -175,6 +175,37 @@ def type_check(value:Any, type_hint:BaseModel|Any) -> bool:
     raise TypeError(f"Type '{type_hint}' is not supported.")
     # return False
 
+def isinstance_types(type_hint:Any) -> tuple[type, ...]|None:
+    """
+    Flattens a type hint into the classes `isinstance` can check it with.
+
+    Plain classes (incl. Pydantic's BaseModel subclasses), `None` and Unions 
+    of those can be checked with a single `isinstance(value, classes)` call, 
+    which gives the same result as `type_check(value, type_hint)` but is much 
+    cheaper, so callers that check many values against one hint can resolve 
+    it once up front.
+
+    Parameters:
+    ----------
+    - type_hint (Any): The type hint to flatten.
+
+    Returns:
+    -------
+    - tuple[type, ...]|None: The classes to check against, or None if the 
+      hint (or any member of the Union) needs `type_check`, e.g. `Any`, 
+      `List[int]` or `Literal[...]`.
+    """
+    if type_hint is None:
+        return (type(None),)
+    origin = get_origin(type_hint)
+    members = get_args(type_hint) if origin in (Union, UnionType) \
+              else (type_hint,)
+    for member in members:
+        if (member is Any or not isinstance(member, type) 
+            or get_origin(member) is not None):
+            return None
+    return members
+
 def validate_forbidden_characters(value: str, forbidden_chars:list[str]) -> str:
     """
     Validate if the given value contains forbidden characters.
@@ -187,8 +218,15 @@ def validate_forbidden_characters(value: str, forbidden_chars:list[str]) -> str:
     -------
         The original value if no forbidden characters are found.
     """
+    value_str = str(value)
+    # single C-level pass for the common, valid case. The table is looked up 
+    # by the current entries, so changes to `forbidden_chars` are picked up
+    table = _deletion_table(tuple(forbidden_chars))
+    if len(value_str.translate(table)) == len(value_str):
+        return value
+    # report the first entry of `forbidden_chars` that is in the value
     for char in forbidden_chars:
-        if char in str(value):
+        if char in value_str:
             raise ValueError(f"Forbidden character '{char}' in channel or "
                              "event_type. Please avoid using any of the "
                              f"following chars: {forbidden_chars}")
@@ -267,3 +305,50 @@ def type_hint_compatible(type_hint_1: Any, type_hint_2: Any) -> bool:
     necessarily have the attributes of an `Employee` (ex: Student).
     """
     raise NotImplementedError("This function is not yet implemented.")
+
+def _has_local_class(type_hint:Any) -> bool:
+    """ True if the hint is, or contains, a class defined inside a function """
+    if isinstance(type_hint, type):
+        return "<locals>" in type_hint.__qualname__
+    return any(_has_local_class(arg) for arg in get_args(type_hint))
+
+@functools.lru_cache(maxsize=1024)
+def _isinstance_types_lru(type_hint:Any) -> tuple[type, ...]|None:
+    return isinstance_types(type_hint)
+
+def _cached_isinstance_types(type_hint:Any) -> tuple[type, ...]|None:
+    """
+    `isinstance_types`, cached per type hint. Hints that can't be hashed 
+    (e.g. `Literal[[1, 2]]`) aren't cached and get None, i.e. the full 
+    `type_check` path. Hints with classes defined inside functions aren't 
+    cached either, since the cache would keep such classes alive.
+    """
+    if _has_local_class(type_hint):
+        return isinstance_types(type_hint)
+    try:
+        # isinstance_types itself never raises, so a TypeError here means 
+        # the hint can't be used as a cache key
+        return _isinstance_types_lru(type_hint)
+    except TypeError:
+        return None
+
+@functools.lru_cache(maxsize=512)
+def _origin_args_lru(type_hint:Any) -> tuple[Any, tuple]:
+    return get_origin(type_hint), get_args(type_hint)
+
+def _origin_args(type_hint:Any) -> tuple[Any, tuple]:
+    """
+    `get_origin` and `get_args` of a type hint, cached if it's hashable and 
+    has no classes defined inside functions (see `_cached_isinstance_types`).
+    """
+    if _has_local_class(type_hint):
+        return get_origin(type_hint), get_args(type_hint)
+    try:
+        return _origin_args_lru(type_hint)
+    except TypeError:  # unhashable, e.g. `Literal[[1, 2]]`
+        return get_origin(type_hint), get_args(type_hint)
+
+@functools.lru_cache(maxsize=64)
+def _deletion_table(forbidden_chars:tuple[str, ...]) -> dict[int, None]:
+    """ `str.translate` table deleting every char of `forbidden_chars` """
+    return str.maketrans("", "", "".join(forbidden_chars))
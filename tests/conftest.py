@@ -0,0 +1,24 @@
+import pytest
+
+# relay requires pydantic (see setup.py) and imports it here, before any test
+# module is collected, so their `from pydantic import ...` lines are just
+# lookups in `sys.modules`
+from relay.bindings import Emitter, Listener
+from relay.event import Event
+from relay.relay import Relay
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup():
+    """
+    run relay's pydantic models and the Event constructor once before the
+    first test, so its timings don't include their first-call costs
+    """
+    Relay.NoEmit(data=None)
+    Event(data=None)
+    class WarmupRelay(Relay):
+        async def method(self, event):
+            pass
+    relay = WarmupRelay()
+    Emitter(method=relay.method)
+    Listener(method=relay.method)
@@ -1,6 +1,7 @@
 import pytest
 
 import asyncio
+import copy
 from relay.bindings import Binding, Listener, Emitter, Bindings
 from relay.relay import Relay
 
@@ -37,10 +38,11 @@ def emitter_binding(dummy_relay:DummyRelay):
 
 
 def test_add_binding():
+    registry = Bindings._registry()
     relay = DummyRelay()
     binding = Binding(method=relay.listener_method)
     Bindings.add(binding)
-    assert binding in Bindings._by_method[relay.listener_method]
+    assert binding in registry.by_method[relay.listener_method]
 
 def test_add_binding_from_outside():
     err_msg="Binding method must come from Relay."
@@ -49,19 +51,21 @@ def test_add_binding_from_outside():
         Bindings.add(binding)
 
 def test_add_listener(dummy_relay, listener_binding):
+    registry = Bindings._registry()
     Bindings.add(listener_binding)
-    assert listener_binding in Bindings._by_method[dummy_relay.listener_method]
-    assert listener_binding in Bindings._by_relay[dummy_relay]
+    assert listener_binding in registry.by_method[dummy_relay.listener_method]
+    assert listener_binding in registry.by_relay[dummy_relay]
     
-    chnl_type_dict = Bindings._by_chnl_and_type[listener_binding.channel]
+    chnl_type_dict = registry.by_chnl_and_type[listener_binding.channel]
     assert listener_binding in chnl_type_dict[listener_binding.event_type]
 
 def test_add_emitter(dummy_relay, emitter_binding):
+    registry = Bindings._registry()
     Bindings.add(emitter_binding)
-    assert emitter_binding in Bindings._by_method[dummy_relay.listener_method]
-    assert emitter_binding in Bindings._by_relay[dummy_relay]
+    assert emitter_binding in registry.by_method[dummy_relay.listener_method]
+    assert emitter_binding in registry.by_relay[dummy_relay]
     
-    chnl_type_dict = Bindings._by_chnl_and_type[emitter_binding.channel]
+    chnl_type_dict = registry.by_chnl_and_type[emitter_binding.channel]
     assert emitter_binding in chnl_type_dict[emitter_binding.event_type]
 
 def test_add_classmethod():
@@ -76,6 +80,7 @@ def test_add_invalid_method_raises_exception():
         Bindings.add(binding)
 
 def test_multiple_bindings_same_function(dummy_relay: DummyRelay):
+    registry = Bindings._registry()
     binding1 = Binding(method=dummy_relay.listener_method)
     binding2 = Binding(method=dummy_relay.listener_method)
     
@@ -83,8 +88,8 @@ def test_multiple_bindings_same_function(dummy_relay: DummyRelay):
     Bindings.add(binding2)
 
     # Check if both bindings are in the appropriate dictionaries
-    assert binding1 in Bindings._by_method[dummy_relay.listener_method]
-    assert binding2 in Bindings._by_method[dummy_relay.listener_method]
+    assert binding1 in registry.by_method[dummy_relay.listener_method]
+    assert binding2 in registry.by_method[dummy_relay.listener_method]
 
 @pytest.mark.skip(reason="Bindings can't check if method belongs to Relay")
 def test_add_classmethod_from_non_relay_class():
@@ -99,9 +104,100 @@ def test_add_classmethod_from_non_relay_class():
 ])
 def test_bindings_different_channels_and_event_types(channel, event_type, 
                                                      dummy_relay: DummyRelay):
+    registry = Bindings._registry()
     binding = Binding(method=dummy_relay.listener_method, channel=channel, 
                       event_type=event_type)
     Bindings.add(binding)
     
     # Ensure that the binding is stored correctly based on channel and event type
-    assert binding in Bindings._by_chnl_and_type[channel][event_type]
+    assert binding in registry.by_chnl_and_type[channel][event_type]
+
+def test_bulk_add(dummy_relay: DummyRelay):
+    registry = Bindings._registry()
+    Bindings.clear()
+    binding1 = Binding(method=dummy_relay.listener_method, channel="channel1")
+    binding2 = Binding(method=dummy_relay.listener_method, channel="channel2")
+    Bindings.bulk_add([binding1, binding2, binding1])
+
+    assert Bindings.count() == 2
+    assert registry.by_method[dummy_relay.listener_method] == [binding1, 
+                                                                binding2]
+    assert binding1 in registry.by_chnl_and_type["channel1"][binding1.event_type]
+    assert binding2 in registry.by_chnl_and_type["channel2"][binding2.event_type]
+
+def test_bulk_add_invalid_binding_adds_nothing(dummy_relay: DummyRelay):
+    registry = Bindings._registry()
+    Bindings.clear()
+    binding = Binding(method=dummy_relay.listener_method)
+    with pytest.raises(ValueError, match="Binding method must come from Relay."):
+        Bindings.bulk_add([binding, Binding(method=dummy_function)])
+    assert Bindings.count() == 0
+    assert not registry.by_method
+
+def test_add_returns_token(dummy_relay: DummyRelay):
+    Bindings.clear()
+    binding1 = Binding(method=dummy_relay.listener_method)
+    binding2 = Binding(method=dummy_relay.listener_method)
+    assert binding1.token != binding2.token
+
+    token = Bindings.add(binding1)
+    assert token == binding1.token
+    assert Bindings.get_by_token(token) is binding1
+    assert Bindings.get_by_token(binding2.token) is None
+
+    Bindings.remove(binding1)
+    assert Bindings.get_by_token(token) is None
+
+def test_add_copy_of_binding_is_ignored(dummy_relay: DummyRelay):
+    Bindings.clear()
+    binding = Binding(method=dummy_relay.listener_method)
+    binding_copy = copy.copy(binding)
+    assert binding_copy.token == binding.token
+
+    Bindings.add(binding)
+    Bindings.add(binding_copy)
+    assert Bindings.count() == 1
+
+
+def test_scope_isolates_bindings(dummy_relay: DummyRelay):
+    Bindings.clear()
+    outer = Binding(method=dummy_relay.listener_method)
+    Bindings.add(outer)
+
+    with Bindings.scope():
+        assert Bindings.count() == 0
+        inner = Binding(method=dummy_relay.listener_method, channel="inner")
+        Bindings.add(inner)
+        assert Bindings.get_by_relay(dummy_relay) == [inner]
+
+    assert Bindings.get_by_relay(dummy_relay) == [outer]
+    assert Bindings.get_by_event("inner", inner.event_type) == []
+
+async def test_scope_is_per_task(dummy_relay: DummyRelay):
+    Bindings.clear()
+
+    async def add_in_scope(channel:str) -> list[Binding]:
+        with Bindings.scope():
+            Bindings.add(Binding(method=dummy_relay.listener_method, 
+                                 channel=channel))
+            await asyncio.sleep(0)
+            return Bindings.get_by_relay(dummy_relay)
+
+    results = await asyncio.gather(add_in_scope("a"), add_in_scope("b"))
+    assert [[b.channel for b in bindings] for bindings in results] == \
+           [["a"], ["b"]]
+    assert Bindings.count() == 0
+
+def test_readd_skips_validation(dummy_relay: DummyRelay, monkeypatch):
+    Bindings.clear()
+    binding = Binding(method=dummy_relay.listener_method)
+    Bindings.add(binding)
+
+    calls = []
+    get_binding_data = Bindings._get_binding_data
+    monkeypatch.setattr(Bindings, "_get_binding_data", 
+                        lambda b: calls.append(b) or get_binding_data(b))
+    Bindings.add(binding)
+    Bindings.bulk_add([binding, copy.copy(binding)])
+    assert calls == []
+    assert Bindings.count() == 1
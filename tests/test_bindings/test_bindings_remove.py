@@ -1,4 +1,7 @@
 import pytest
+
+import gc
+import weakref
 from relay.bindings import Binding, Listener, Emitter, Bindings
 from relay.relay import Relay
 
@@ -25,6 +28,7 @@ def test_bindings_clear():
     """
     Ensure the `clear` method resets all Bindings collections.
     """
+    registry = Bindings._registry()
     dummy_relay = DummyRelay()
     
     binding1 = Binding(method=dummy_relay.listener_method, channel="custom_channel")
@@ -32,34 +36,36 @@ def test_bindings_clear():
     Bindings.add(binding1)
     Bindings.add(binding2)
     
-    assert Bindings._by_chnl_and_type
-    assert Bindings._by_relay
-    assert Bindings._by_method
+    assert registry.by_chnl_and_type
+    assert registry.by_relay
+    assert registry.by_method
     
     Bindings.clear()
     
-    assert not Bindings._by_chnl_and_type
-    assert not Bindings._by_relay
-    assert not Bindings._by_method
+    assert not registry.by_chnl_and_type
+    assert not registry.by_relay
+    assert not registry.by_method
 
 
 def test_remove_binding(binding, dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
     Bindings.add(binding)
     Bindings.remove(binding)
-    assert binding not in Bindings._by_method[dummy_relay.listener_method]
-    assert binding not in Bindings._by_relay[dummy_relay]
-    assert binding not in Bindings._by_chnl_and_type[binding.channel][binding.event_type]
+    assert binding not in registry.by_method[dummy_relay.listener_method]
+    assert binding not in registry.by_relay[dummy_relay]
+    assert binding not in registry.by_chnl_and_type[binding.channel][binding.event_type]
 
 
 def test_remove_binding_with_relay(dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
     binding = Binding(method=dummy_relay.listener_method)
     Bindings.add(binding)
     Bindings.remove_relay(dummy_relay)
-    assert dummy_relay not in Bindings._by_relay
-    assert binding not in Bindings._by_method[dummy_relay.listener_method]
-    assert binding not in Bindings._by_chnl_and_type[binding.channel][binding.event_type]
+    assert dummy_relay not in registry.by_relay
+    assert binding not in registry.by_method[dummy_relay.listener_method]
+    assert binding not in registry.by_chnl_and_type[binding.channel][binding.event_type]
 
 def test_remove_from_empty_binding_collection(binding):
     Bindings.clear()
@@ -72,11 +78,12 @@ def test_remove_from_empty_binding_collection(binding):
         assert False  # If an exception was thrown, fail the test
 
 def test_remove_nonexistent_binding(binding, dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
     Bindings.remove(binding)  # this should not raise an error even though the binding was not added
-    assert binding not in Bindings._by_method[dummy_relay.listener_method]
-    assert binding not in Bindings._by_relay[dummy_relay]
-    assert binding not in Bindings._by_chnl_and_type[binding.channel][binding.event_type]
+    assert binding not in registry.by_method[dummy_relay.listener_method]
+    assert binding not in registry.by_relay[dummy_relay]
+    assert binding not in registry.by_chnl_and_type[binding.channel][binding.event_type]
 
 def test_remove_none_binding():
     Bindings.clear()
@@ -87,6 +94,7 @@ def test_remove_none_binding():
         assert False  # If an exception was thrown, fail the test
 
 def test_remove_binding_different_channels(dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
     binding1 = Binding(method=dummy_relay.listener_method, channel="channel1")
     binding2 = Binding(method=dummy_relay.listener_method, channel="channel2")
@@ -94,10 +102,11 @@ def test_remove_binding_different_channels(dummy_relay):
     Bindings.add(binding2)
     Bindings.remove(binding1)
     
-    assert binding1 not in Bindings._by_chnl_and_type["channel1"][binding1.event_type]
-    assert binding2 in Bindings._by_chnl_and_type["channel2"][binding2.event_type]
+    assert binding1 not in registry.by_chnl_and_type["channel1"][binding1.event_type]
+    assert binding2 in registry.by_chnl_and_type["channel2"][binding2.event_type]
 
 def test_binding_count_after_adds_and_removes(dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
     binding = Binding(method=dummy_relay.listener_method)
     Bindings.add(binding)
@@ -105,21 +114,38 @@ def test_binding_count_after_adds_and_removes(dummy_relay):
     Bindings.remove(binding)
 
     # Depending on your desired behavior, the binding might still exist or not. Adjust the test accordingly.
-    assert binding not in Bindings._by_method[dummy_relay.listener_method]
+    assert binding not in registry.by_method[dummy_relay.listener_method]
+
+def test_count_tracks_adds_and_removes(dummy_relay):
+    Bindings.clear()
+    binding1 = Binding(method=dummy_relay.listener_method, channel="channel1")
+    binding2 = Binding(method=dummy_relay.another_listener, channel="channel2")
+    Bindings.add(binding1)
+    Bindings.add(binding1)  # duplicate add is ignored
+    Bindings.add(binding2)
+    assert Bindings.count() == 2
+    Bindings.remove(binding1)
+    Bindings.remove(binding1)  # duplicate remove is ignored
+    assert Bindings.count() == 1
+    Bindings.clear()
+    assert Bindings.count() == 0
 
 def test_remove_unbound_relay(dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
     Bindings.remove_relay(dummy_relay)  # this should not raise an error
-    assert dummy_relay not in Bindings._by_relay
+    assert dummy_relay not in registry.by_relay
 
 def test_remove_event_type_after_removing_binding(dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
     binding = Binding(method=dummy_relay.listener_method, event_type="custom_event")
     Bindings.add(binding)
     Bindings.remove(binding)
-    assert "custom_event" not in Bindings._by_chnl_and_type[binding.channel]
+    assert "custom_event" not in registry.by_chnl_and_type[binding.channel]
 
 def test_remove_function_after_removing_all_bindings(dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
     binding1 = Binding(method=dummy_relay.listener_method)
     binding2 = Binding(method=dummy_relay.listener_method, channel="channel2")
@@ -127,21 +153,23 @@ def test_remove_function_after_removing_all_bindings(dummy_relay):
     Bindings.add(binding2)
     Bindings.remove(binding1)
     Bindings.remove(binding2)
-    assert dummy_relay.listener_method not in Bindings._by_method
+    assert dummy_relay.listener_method not in registry.by_method
 
 def test_add_remove_multiple_bindings_same_function_different_channels(dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
     binding1 = Binding(method=dummy_relay.listener_method, channel="channel1")
     binding2 = Binding(method=dummy_relay.listener_method, channel="channel2")
     Bindings.add(binding1)
     Bindings.add(binding2)
     Bindings.remove(binding1)
-    assert binding1 not in Bindings._by_chnl_and_type["channel1"][binding1.event_type]
-    assert binding2 in Bindings._by_chnl_and_type["channel2"][binding2.event_type]
+    assert binding1 not in registry.by_chnl_and_type["channel1"][binding1.event_type]
+    assert binding2 in registry.by_chnl_and_type["channel2"][binding2.event_type]
     Bindings.remove(binding2)
-    assert binding2 not in Bindings._by_chnl_and_type["channel2"][binding2.event_type]
+    assert binding2 not in registry.by_chnl_and_type["channel2"][binding2.event_type]
 
 def test_add_remove_multiple_bindings_different_functions(dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
 
     binding1 = Binding(method=dummy_relay.listener_method)
@@ -149,16 +177,46 @@ def test_add_remove_multiple_bindings_different_functions(dummy_relay):
     Bindings.add(binding1)
     Bindings.add(binding2)
     Bindings.remove(binding1)
-    assert binding1 not in Bindings._by_method[dummy_relay.listener_method]
-    assert binding2 in Bindings._by_method[dummy_relay.another_listener]
+    assert binding1 not in registry.by_method[dummy_relay.listener_method]
+    assert binding2 in registry.by_method[dummy_relay.another_listener]
 
 def test_remove_relay_multiple_times(dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
     binding = Binding(method=dummy_relay.listener_method)
     Bindings.add(binding)
     Bindings.remove_relay(dummy_relay)
     Bindings.remove_relay(dummy_relay)  # should not raise an error
-    assert dummy_relay not in Bindings._by_relay
+    assert dummy_relay not in registry.by_relay
+
+def test_remove_relay_with_multiple_bindings(dummy_relay):
+    registry = Bindings._registry()
+    Bindings.clear()
+    binding1 = Binding(method=dummy_relay.listener_method, channel="channel1")
+    binding2 = Binding(method=dummy_relay.another_listener, channel="channel2")
+    binding3 = Binding(method=dummy_relay.listener_method, channel="channel3")
+    Bindings.add(binding1)
+    Bindings.add(binding2)
+    Bindings.add(binding3)
+    Bindings.remove_relay(dummy_relay)
+    assert dummy_relay not in registry.by_relay
+    assert not registry.by_method
+    assert not registry.by_chnl_and_type
+
+def test_bulk_remove(dummy_relay):
+    registry = Bindings._registry()
+    Bindings.clear()
+    binding1 = Binding(method=dummy_relay.listener_method, channel="channel1")
+    binding2 = Binding(method=dummy_relay.another_listener, channel="channel1")
+    binding3 = Binding(method=dummy_relay.listener_method, channel="channel2")
+    Bindings.bulk_add([binding1, binding2, binding3])
+    Bindings.bulk_remove([binding1, None, binding3, binding3])
+
+    assert Bindings.count() == 1
+    assert dummy_relay.listener_method not in registry.by_method
+    assert "channel2" not in registry.by_chnl_and_type
+    assert registry.by_chnl_and_type["channel1"][binding2.event_type] == [binding2]
+    assert registry.by_relay[dummy_relay] == [binding2]
 
 def test_remove_unbound_function_binding():
     Bindings.clear()
@@ -171,6 +229,7 @@ def test_remove_unbound_function_binding():
         Bindings.remove(binding)
 
 def test_interleaved_add_remove_operations(dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
     binding1 = Binding(method=dummy_relay.listener_method, channel="channel1")
     binding2 = Binding(method=dummy_relay.listener_method, channel="channel2")
@@ -186,42 +245,46 @@ def test_interleaved_add_remove_operations(dummy_relay):
     Bindings.add(binding5)
     Bindings.remove(binding4)
 
-    assert binding1 in Bindings._by_chnl_and_type["channel1"][binding1.event_type]
-    assert binding2 not in Bindings._by_chnl_and_type["channel2"][binding2.event_type]
-    assert binding3 in Bindings._by_chnl_and_type["channel3"][binding3.event_type]
-    assert binding4 not in Bindings._by_chnl_and_type["channel4"][binding4.event_type]
-    assert binding5 in Bindings._by_chnl_and_type["channel5"][binding5.event_type]
+    assert binding1 in registry.by_chnl_and_type["channel1"][binding1.event_type]
+    assert binding2 not in registry.by_chnl_and_type["channel2"][binding2.event_type]
+    assert binding3 in registry.by_chnl_and_type["channel3"][binding3.event_type]
+    assert binding4 not in registry.by_chnl_and_type["channel4"][binding4.event_type]
+    assert binding5 in registry.by_chnl_and_type["channel5"][binding5.event_type]
 
 def test_remove_multiple_event_types(dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
     binding1 = Binding(method=dummy_relay.listener_method, event_type="custom_event1")
     binding2 = Binding(method=dummy_relay.listener_method, event_type="custom_event2")
     Bindings.add(binding1)
     Bindings.add(binding2)
     Bindings.remove(binding1)
-    assert "custom_event1" not in Bindings._by_chnl_and_type[binding1.channel]
-    assert "custom_event2" in Bindings._by_chnl_and_type[binding2.channel]
+    assert "custom_event1" not in registry.by_chnl_and_type[binding1.channel]
+    assert "custom_event2" in registry.by_chnl_and_type[binding2.channel]
 
 def test_add_remove_same_event_type_different_bindings(dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
     binding1 = Binding(method=dummy_relay.listener_method, event_type="custom_event")
     binding2 = Binding(method=dummy_relay.another_listener, event_type="custom_event")
     Bindings.add(binding1)
     Bindings.add(binding2)
     Bindings.remove(binding1)
-    assert binding1 not in Bindings._by_method[dummy_relay.listener_method]
-    assert binding2 in Bindings._by_method[dummy_relay.another_listener]
+    assert binding1 not in registry.by_method[dummy_relay.listener_method]
+    assert binding2 in registry.by_method[dummy_relay.another_listener]
 
 def test_remove_binding_added_multiple_times(dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
     binding = Binding(method=dummy_relay.listener_method)
     Bindings.add(binding)
     Bindings.add(binding)  # add again
     Bindings.remove(binding)
     Bindings.remove(binding)  # remove again, shouldn't raise an error
-    assert binding not in Bindings._by_method[dummy_relay.listener_method]
+    assert binding not in registry.by_method[dummy_relay.listener_method]
 
 def test_remove_channel_after_removing_all_bindings(dummy_relay):
+    registry = Bindings._registry()
     Bindings.clear()
     binding1 = Binding(method=dummy_relay.listener_method, channel="custom_channel")
     binding2 = Binding(method=dummy_relay.another_listener, channel="custom_channel")
@@ -229,13 +292,14 @@ def test_remove_channel_after_removing_all_bindings(dummy_relay):
     Bindings.add(binding2)
     Bindings.remove(binding1)
     Bindings.remove(binding2)
-    assert "custom_channel" not in Bindings._by_chnl_and_type
+    assert "custom_channel" not in registry.by_chnl_and_type
 
 def test_remove_channel_after_all_bindings_removed(dummy_relay):
     """
     Ensure that when all bindings of a channel are removed, 
     the channel itself is removed from `_by_chnl_and_type`.
     """
+    registry = Bindings._registry()
     Bindings.clear()
     binding1 = Binding(method=dummy_relay.listener_method, channel="custom_channel")
     binding2 = Binding(method=dummy_relay.another_listener, channel="custom_channel")
@@ -243,13 +307,14 @@ def test_remove_channel_after_all_bindings_removed(dummy_relay):
     Bindings.add(binding2)
     Bindings.remove(binding1)
     Bindings.remove(binding2)
-    assert "custom_channel" not in Bindings._by_chnl_and_type
+    assert "custom_channel" not in registry.by_chnl_and_type
 
 def test_remove_function_after_all_bindings_removed(dummy_relay):
     """
     Ensure that when all bindings of a specific function are removed, 
     the function key itself is removed from `_by_function`.
     """
+    registry = Bindings._registry()
     Bindings.clear()
     binding1 = Binding(method=dummy_relay.listener_method)
     binding2 = Binding(method=dummy_relay.listener_method, channel="custom_channel")
@@ -257,13 +322,14 @@ def test_remove_function_after_all_bindings_removed(dummy_relay):
     Bindings.add(binding2)
     Bindings.remove(binding1)
     Bindings.remove(binding2)
-    assert dummy_relay.listener_method not in Bindings._by_method
+    assert dummy_relay.listener_method not in registry.by_method
 
 def test_remove_relay_after_all_bindings_removed(dummy_relay):
     """
     Ensure that when all bindings of a specific relay instance are removed, 
     the relay key itself is removed from `_by_relay`.
     """
+    registry = Bindings._registry()
     Bindings.clear()
     binding1 = Binding(method=dummy_relay.listener_method)
     binding2 = Binding(method=dummy_relay.another_listener, channel="custom_channel")
@@ -271,13 +337,14 @@ def test_remove_relay_after_all_bindings_removed(dummy_relay):
     Bindings.add(binding2)
     Bindings.remove(binding1)
     Bindings.remove(binding2)
-    assert dummy_relay not in Bindings._by_relay
+    assert dummy_relay not in registry.by_relay
 
 def test_remove_channel_after_removing_all_event_types(dummy_relay):
     """
     Ensure that when all event types of a specific channel are removed,
     the channel key itself is removed from `_by_chnl_and_type`.
     """
+    registry = Bindings._registry()
     Bindings.clear()
     binding1 = Binding(method=dummy_relay.listener_method, channel="custom_channel", event_type="event1")
     binding2 = Binding(method=dummy_relay.another_listener, channel="custom_channel", event_type="event2")
@@ -285,4 +352,43 @@ def test_remove_channel_after_removing_all_event_types(dummy_relay):
     Bindings.add(binding2)
     Bindings.remove(binding1)
     Bindings.remove(binding2)
-    assert "custom_channel" not in Bindings._by_chnl_and_type
+    assert "custom_channel" not in registry.by_chnl_and_type
+
+def test_collected_relay_bindings_are_dropped():
+    """
+    Ensure that bindings don't keep their relay alive and that they are 
+    dropped from all collections once the relay is garbage collected.
+    """
+    registry = Bindings._registry()
+    Bindings.clear()
+    relay = DummyRelay()
+    relay_ref = weakref.ref(relay)
+    binding = Binding(method=relay.listener_method, channel="custom_channel")
+    Bindings.add(binding)
+
+    del relay
+    gc.collect()
+    assert relay_ref() is None
+    assert Bindings.count() == 0
+    assert Bindings.get_by_token(binding.token) is None
+    assert "custom_channel" not in registry.by_chnl_and_type
+    assert not registry.by_relay
+    assert not registry.by_method
+
+def test_relays_are_indexed_by_identity():
+    """
+    Ensure relays are looked up by identity, not by their `__eq__`.
+    """
+    class EqualRelay(DummyRelay):
+        def __eq__(self, other):
+            return True
+        def __hash__(self):
+            return 0
+
+    Bindings.clear()
+    relay1, relay2 = EqualRelay(), EqualRelay()
+    binding = Binding(method=relay1.listener_method)
+    Bindings.add(binding)
+    assert Bindings.get_by_relay(relay1) == [binding]
+    assert Bindings.get_by_relay(relay2) == []
+    assert Bindings.get_by_method(relay2.listener_method) == []
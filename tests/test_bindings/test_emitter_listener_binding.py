@@ -1,9 +1,13 @@
 import pytest
 
+import copy
+import gc
+import weakref
 from pydantic import ValidationError
 from relay.bindings import Binding, Listener, Emitter, SourceInfo
 from relay.consts import DEFAULT_CHANNEL, DEFAULT_EVENT_TYPE
 from relay.event import FORBIDDEN_CHARACTERS
+from relay.relay import Relay
 
 # 1. Basic Instantiation
 
@@ -46,19 +50,12 @@ def test_emission_invalid_emitter():
 
 # 4. Forbidden Characters
 
-def test_forbidden_characters_in_bindings():
-    for char in FORBIDDEN_CHARACTERS:
-        with pytest.raises(ValueError, match=f"Forbidden character '{char}'"):
-            Listener(method=sample_async_func, channel=f"channel{char}")
-            
-        with pytest.raises(ValueError, match=f"Forbidden character '{char}'"):
-            Listener(method=sample_async_func, event_type=f"event{char}")
-            
-        with pytest.raises(ValueError, match=f"Forbidden character '{char}'"):
-            Emitter(method=sample_async_func, channel=f"channel{char}")
-            
-        with pytest.raises(ValueError, match=f"Forbidden character '{char}'"):
-            Emitter(method=sample_async_func, event_type=f"event{char}")
+@pytest.mark.parametrize("char", FORBIDDEN_CHARACTERS)
+@pytest.mark.parametrize("field", ["channel", "event_type"])
+@pytest.mark.parametrize("cls", [Listener, Emitter])
+def test_forbidden_characters_in_bindings(cls, field, char):
+    with pytest.raises(ValueError, match=f"Forbidden character '{char}'"):
+        cls(method=sample_async_func, **{field: f"{field}{char}"})
 
 # 5. Sync function test
 def test_sync_method():
@@ -67,3 +64,66 @@ def test_sync_method():
     
     with pytest.raises(TypeError, match="The method must be asynchronous."):
         emit = Emitter(method=sample_sync_func)
+
+# 6. Bound methods are weakly referenced
+
+class DummyRelay(Relay):
+    async def listener_method(self, event):
+        pass
+
+def test_binding_does_not_keep_relay_alive():
+    relay = DummyRelay()
+    relay_ref = weakref.ref(relay)
+    listener = Listener(method=relay.listener_method)
+    assert listener.method == relay.listener_method
+
+    del relay
+    gc.collect()
+    assert relay_ref() is None
+    assert listener.method is None
+
+def test_binding_keeps_function():
+    listener = Listener(method=sample_async_func)
+    assert listener.method is sample_async_func
+
+# 7. Equality and hashing
+
+def test_binding_equality_follows_token():
+    listener = Listener(method=sample_async_func)
+    assert listener == listener
+    assert listener == copy.copy(listener)
+    assert hash(listener) == hash(copy.copy(listener))
+    # same fields, but a separately created binding
+    assert listener != Listener(method=sample_async_func)
+    assert len({listener, copy.copy(listener), 
+                Listener(method=sample_async_func)}) == 2
+
+# 8. Slots and immutability
+
+@pytest.mark.parametrize("cls", [Binding, Listener, Emitter])
+def test_binding_has_no_instance_dict(cls):
+    binding = cls(method=sample_async_func)
+    assert not hasattr(binding, "__dict__")
+
+def test_binding_is_frozen():
+    listener = Listener(method=sample_async_func)
+    with pytest.raises(AttributeError):
+        listener.channel = "other"
+
+# 9. Sources
+
+def test_listeners_keep_their_own_dict_source():
+    class SourceRelay(Relay):
+        async def emitter(self):
+            pass
+
+    relay1, relay2 = SourceRelay(), SourceRelay()
+    listener1 = Listener(method=sample_async_func, 
+                         source={"relay": relay1, "emitter": relay1.emitter})
+    listener2 = Listener(method=sample_async_func, 
+                         source={"relay": relay2, "emitter": relay2.emitter})
+
+    assert listener1.source is not listener2.source
+    assert listener1.source == SourceInfo(relay=relay1, emitter=relay1.emitter)
+    assert listener2.source == SourceInfo(relay=relay2, emitter=relay2.emitter)
+    assert SourceInfo() == SourceInfo(relay=None, emitter=None)
@@ -70,6 +70,27 @@ def test_get_by_method():
         Bindings.remove(class_binding)
 
 
+def test_get_by_function():
+    Bindings.clear()
+    relay1, relay2 = DummyRelay(), DummyRelay()
+    listener1 = Listener(method=relay1.listener_method)
+    listener2 = Listener(method=relay2.listener_method)
+    emitter = Emitter(method=relay2.listener_method)
+    Bindings.bulk_add([listener1, listener2, emitter])
+
+    bindings = Bindings.get_by_function(DummyRelay.listener_method)
+    assert bindings == [listener1, listener2, emitter]
+    assert Bindings.get_by_function(relay1.listener_method) == bindings
+    assert Bindings.get_by_function(DummyRelay.listener_method, 
+                                    filter_=Emitter) == [emitter]
+
+    Bindings.remove_relay(relay2)
+    assert Bindings.get_by_function(DummyRelay.listener_method) == [listener1]
+    Bindings.remove(listener1)
+    assert Bindings.get_by_function(DummyRelay.listener_method) == []
+    assert not Bindings._registry().by_func
+
+
 def test_get_by_method_no_bindings():
     Bindings.clear()
     bindings = Bindings.get_by_method(standalone_function)
@@ -164,6 +185,19 @@ def test_no_matches():
     assert len(no_matches) == 0
 
 
+def test_lookups_do_not_create_entries():
+    registry = Bindings._registry()
+    Bindings.clear()
+    relay_instance = DummyRelay()
+    Bindings.get_by_event("channelZ", "eventZ")
+    Bindings.get_by_event("channelZ", "event*")
+    Bindings.get_by_relay(relay_instance)
+    Bindings.get_by_method(relay_instance.listener_method)
+    assert not registry.by_chnl_and_type
+    assert not registry.by_relay
+    assert not registry.by_method
+
+
 def test_only_wildcards():
     Bindings.clear()
     relay_instance = DummyRelay()
@@ -251,3 +285,31 @@ def test_special_characters_in_patterns():
     assert listener_binding in special_bindings
 
     Bindings.remove(listener_binding)
+
+
+def test_get_listeners():
+    Bindings.clear()
+    relay_instance = DummyRelay()
+    listener1 = Listener(method=relay_instance.listener_method, 
+                         channel="channelA", event_type="eventA")
+    emitter = Emitter(method=relay_instance.listener_method, 
+                      channel="channelA", event_type="eventA")
+    Bindings.add(listener1)
+    Bindings.add(emitter)
+
+    listeners = Bindings.get_listeners("channelA", "eventA")
+    assert listeners == (listener1,)
+    assert Bindings.get_listeners("channelA", "eventA") is listeners
+    assert Bindings.get_listeners("channel*", "*") == (listener1,)
+
+    listener2 = Listener(method=relay_instance.listener_method, 
+                         channel="channelA", event_type="eventA")
+    Bindings.add(listener2)
+    assert Bindings.get_listeners("channelA", "eventA") == (listener1, 
+                                                            listener2)
+    Bindings.remove(listener1)
+    assert Bindings.get_listeners("channelA", "eventA") == (listener2,)
+
+    assert Bindings.get_listeners("channelZ", "eventZ") == ()
+    assert ("channelZ", "eventZ") not in Bindings._registry().listeners
+    Bindings.clear()
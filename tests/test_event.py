@@ -1,5 +1,9 @@
 import pytest
 
+import copy
+import sys
+import threading
+import time
 from relay.event import Event, SourceInfo, FORBIDDEN_CHARACTERS
 from relay.consts import DEFAULT_CHANNEL, DEFAULT_EVENT_TYPE
 
@@ -44,6 +48,14 @@ def test_event_with_invalid_func():
         source_info = SourceInfo(relay=None, emitter="Invalid Function")
         event = Event(data=data, source=source_info)
 
+def test_event_channel_and_event_type_are_interned():
+    """Test that channel and event_type are interned for fast lookups."""
+    channel = "".join(["MA", "IN"])
+    event_type = "".join(["GREET", "ING"])
+    event = Event(data="Hello!", channel=channel, event_type=event_type)
+    assert event.channel is sys.intern("MAIN")
+    assert event.event_type is sys.intern("GREETING")
+
 def test_event_timestamp_generation():
     """Test that the Event class generates a timestamp upon instantiation."""
     data = {"message": "Hello!"}
@@ -109,6 +121,15 @@ def test_source_info_defaults():
     assert source_info.relay is None
     assert source_info.emitter is None
 
+def test_source_info_is_frozen():
+    """Test that SourceInfo can't be changed once created."""
+    with pytest.raises(AttributeError):
+        SourceInfo().emitter = print
+
+    source_info = SourceInfo(emitter=print)
+    assert copy.copy(source_info) == source_info
+    assert SourceInfo().emitter is None
+
 def test_event_reproduction():
     """Test if two events with the same data are equal."""
     data = {"message": "Hello!"}
@@ -116,6 +137,51 @@ def test_event_reproduction():
     event2 = Event(data=data)
     assert event1 != event2, "Events with the same data are not equal!"
 
+def test_event_timestamps_are_strictly_increasing():
+    events = [Event(data=i) for i in range(1000)]
+    assert all(a.time < b.time for a, b in zip(events, events[1:]))
+
+def test_event_timestamps_are_unique_across_threads():
+    times = []
+    def build():
+        times.extend(Event(data=i).time for i in range(1000))
+    threads = [threading.Thread(target=build) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(times)) == len(times) == 4000
+
+def test_event_wall_time():
+    before = time.time()
+    event = Event(data="Sample Data")
+    assert abs(event.wall_time - before) < 0.5
+
+def test_unchecked_event_matches_validated_event():
+    source = SourceInfo()
+    before = Event(data=None)
+    event = Event._unchecked(data=[1, 2], channel="MAIN", 
+                             event_type="GREETING", source=source)
+    after = Event(data=None)
+    assert event == Event(data=[1, 2], channel="MAIN", event_type="GREETING",
+                          source=source, time=event.time)
+    assert before.time < event.time < after.time
+
+def test_event_model_validate():
+    event = Event(data="Hello!")
+    assert Event.model_validate(event) is event
+    validated = Event.model_validate({"data": "Hello!", "channel": "MAIN"})
+    assert validated.data == "Hello!" and validated.channel == "MAIN"
+    with pytest.raises(ValueError):
+        Event.model_validate("Hello!")
+
+def test_event_source_from_mapping():
+    event = Event(data="Hello!", source={"relay": None, "emitter": print})
+    assert event.source == SourceInfo(relay=None, emitter=print)
+
+def test_event_none_data():
+    assert Event(data=None).data is None
+
 def test_event_string_representation():
     """Test the string representation of the Event class."""
     data = {"message": "Hello!"}
@@ -133,6 +199,15 @@ def test_event_string_representation():
                           f"channel='DEFAULT', event_type='DEFAULT', "
                           f"source=None, time={event.time})")
 
+def test_event_string_reflects_changes():
+    event = Event(data=[1, 2])
+    assert "data=[1, 2]," in str(event)
+
+    event.data.append(3)
+    assert "data=[1, 2, 3]," in str(event)
+    event.channel = "OTHER"
+    assert "channel='OTHER'" in str(event)
+
 def test_forbidden_characters_in_event():
     for char in FORBIDDEN_CHARACTERS:
         with pytest.raises(ValueError, match=f"Forbidden character '{char}'"):
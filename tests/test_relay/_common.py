@@ -0,0 +1,10 @@
+""" shared helpers for the relay tests """
+
+
+def expected_mismatch_message(event, method, inferred_type) -> str:
+    """ the TypeError message @listens raises for data of the wrong type """
+    return (f"Event data: -> {event.data} <- "
+            f"of type {type(event.data)} "
+            f"does not match the inferred type {inferred_type} "
+            f"hinted to the decorated method "
+            f"'{method.__name__}(self, event:Event[T])'.")
@@ -4,7 +4,6 @@ import asyncio
 import logging
 import time
 from pydantic import BaseModel
-from typing import Any
 from relay.event import Event, SourceInfo
 from relay.relay import Relay
 from relay.bindings import Listener, Emitter, Binding, Bindings
@@ -1,11 +1,11 @@
-""" testing @listens decorator inside the Relay class """
+""" testing the listener decorators inside the Relay class """
 import pytest
 
 from pydantic import BaseModel
 from relay.event import Event
 from relay.relay import Relay
 
-MAGENTA = "\033[35m"; RESET = "\033[0m"
+from ._common import expected_mismatch_message
 
 
 async def test_listens_without_event_parameter():
@@ -26,21 +26,27 @@ async def test_listens_with_incorrect_event_type():
 class SomeModel(BaseModel):
     message: str
 
+EventSomeModel = Event[SomeModel]
+
 
 class DummyRelay(Relay):
 
     @Relay.listens
-    async def some_method_with_event(self, event: Event[SomeModel]):
+    async def some_method_with_event(self, event: EventSomeModel):
         return event.data.message
-    
+
     @Relay.listens
     async def method_with_no_event_type(self, event:Event):
         return event.data
-   
 
-async def test_listens_data_validation():
+@pytest.fixture(scope="module")
+def relay_instance():
+    # the tests only call the listeners, so one instance can be shared
+    return DummyRelay()
+
+
+async def test_listens_data_validation(relay_instance):
     """Test @listens decorator for event data type validation."""
-    relay_instance = DummyRelay()
 
     # valid because some_method_with_event expects an Event[SomeModel]
     valid_event = Event(data=SomeModel(message="Valid"))
@@ -48,38 +54,30 @@ async def test_listens_data_validation():
 
     # invalid because some_method_with_event expects an Event[SomeModel]
     invalid_event = Event(data={"not_a_message": "Invalid"})
-    with pytest.raises(TypeError):
-        await relay_instance.some_method_with_event(invalid_event)
-    
-    try:
+    with pytest.raises(TypeError) as exc_info:
         await relay_instance.some_method_with_event(invalid_event)
-    except TypeError as e:
-        print(f"{MAGENTA}{e}{RESET}")
-        assert str(e) == (f"Event data: -> {invalid_event.data} <- "
-                          f"of type {type(invalid_event.data)} "
-                          f"does not match the inferred type {SomeModel} "
-                          f"hinted to the decorated method "
-                          f"'{relay_instance.some_method_with_event.__name__}"
-                          "(self, event:Event[T])'.")
-
-async def test_listens_no_data_validation():
+
+    assert str(exc_info.value) == expected_mismatch_message(
+        invalid_event, relay_instance.some_method_with_event, SomeModel)
+
+# a variety of data types since there's no specific type to validate against
+NO_VALIDATION_DATA = (
+    SomeModel(message="Valid"),
+    {"not_a_message": "Invalid"},
+    "random_string",
+    12345,
+    [1, 2, 3, 4],
+    (5, 6, 7, 8),
+    None,
+)
+
+@pytest.mark.parametrize("data", NO_VALIDATION_DATA, 
+                         ids=["model", "dict", "str", "int", "list", "tuple", 
+                              "none"])
+async def test_listens_no_data_validation(relay_instance, data):
     """Test @listens decorator when no type hint is provided for event."""
-    relay_instance = DummyRelay()
-
-    # Test with a variety of data types since there's no specific 
-    # type to validate against
-    test_data = [
-        SomeModel(message="Valid"),
-        {"not_a_message": "Invalid"},
-        "random_string",
-        12345,
-        [1, 2, 3, 4],
-        (5, 6, 7, 8),
-        None
-    ]
-    for data in test_data:
-        event = Event(data=data)
-        assert await relay_instance.method_with_no_event_type(event) == data
+    event = Event(data=data)
+    assert await relay_instance.method_with_no_event_type(event) == data
 
 async def test_listens_outside_relay():
     """ Test `listens` decorator's behavior when used outside of `Relay` 
@@ -87,7 +85,7 @@ async def test_listens_outside_relay():
     """
     class NotARelay:
         @Relay.listens
-        async def some_method(self, event: Event[SomeModel]):
+        async def some_method(self, event: EventSomeModel):
             return event.data.message
 
     instance = NotARelay()
@@ -101,7 +99,7 @@ async def test_listens_on_sync_method():
     with pytest.raises(TypeError) as exc_info:
         class DummyRelaySync(Relay):
             @Relay.listens
-            def sync_method(self, event: Event[SomeModel]):
+            def sync_method(self, event: EventSomeModel):
                 return event.data.message
 
     expected_error_msg = (
@@ -128,18 +126,21 @@ class DummyListenerRelay(Relay):
     async def non_listener(self, event: Event[DummyData]):
         return event.data.content
 
+@pytest.fixture(scope="module")
+def listener_relay():
+    # the tests only call the listeners, so one instance can be shared
+    return DummyListenerRelay()
+
 
-async def test_listens_decorator_valid_data_type():
-    relay_instance = DummyListenerRelay()
+async def test_listens_decorator_valid_data_type(listener_relay):
     event = Event(data=DummyData(content="Hello"))
-    content = await relay_instance.valid_listener(event)
+    content = await listener_relay.valid_listener(event)
     assert content == "Hello"
 
-async def test_listens_decorator_invalid_data_type():
-    relay_instance = DummyListenerRelay()
+async def test_listens_decorator_invalid_data_type(listener_relay):
     event = Event(data=DummyData(content="Hello"))
     with pytest.raises(TypeError):
-        await relay_instance.invalid_data_listener(event)
+        await listener_relay.invalid_data_listener(event)
 
 async def test_listens_decorator_outside_relay():
     class NotARelay:
@@ -166,3 +167,28 @@ async def test_listens_decorator_without_event_parameter():
             @Relay.listens
             async def method_without_event(self):
                 pass
+
+async def test_listens_decorator_resolves_type_once(listener_relay, 
+                                                    monkeypatch):
+    """ the event type is resolved when decorating, not on every call """
+    def fail(*args, **kwargs):
+        raise AssertionError("signature inspected at call time")
+    monkeypatch.setattr("inspect.signature", fail)
+    monkeypatch.setattr("typing.get_type_hints", fail)
+
+    event = Event(data=DummyData(content="Hello"))
+    assert await listener_relay.valid_listener(event) == "Hello"
+    with pytest.raises(TypeError, match="does not match the inferred type"):
+        await listener_relay.invalid_data_listener(event)
+
+async def test_listens_decorator_union_data_type():
+    class UnionRelay(Relay):
+        @Relay.listens
+        async def listener(self, event: Event[int|str]):
+            return event.data
+
+    relay_instance = UnionRelay()
+    assert await relay_instance.listener(Event(data=1)) == 1
+    assert await relay_instance.listener(Event(data="a")) == "a"
+    with pytest.raises(TypeError):
+        await relay_instance.listener(Event(data=1.5))
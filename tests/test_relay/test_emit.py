@@ -1,10 +1,12 @@
 import pytest
 
 import asyncio
+import collections
+import contextvars
 import logging
+import sys
 import time
 from pydantic import BaseModel
-from typing import Any
 from relay.event import Event, SourceInfo
 from relay.relay import Relay
 from relay.bindings import Listener, Emitter, Bindings
@@ -17,6 +19,51 @@ logger = logging.getLogger(__name__)
 GREEN, RST = "\033[92m", "\033[0m"
 
 
+class LazyEvent(asyncio.Event):
+    """ `asyncio.Event` that only allocates its waiters deque when awaited """
+    def __init__(self):
+        self._value = False
+        self._waiters = None
+
+    def wait(self):
+        if self._waiters is None:
+            self._waiters = collections.deque()
+        return super().wait()
+
+    def set(self):
+        if self._waiters is None:
+            self._value = True
+            return
+        super().set()
+
+
+CH, ET = "test_channel", "test_event"
+
+def bind_emitter(method, **kwargs) -> Emitter:
+    """ registers an emitter of `method` on CH/ET (unless overridden) """
+    binding = Emitter(method=method, **{"channel": CH, "event_type": ET, 
+                                        **kwargs})
+    Bindings.add(binding)
+    return binding
+
+def bind_listener(method, **kwargs) -> Listener:
+    """ registers a listener of `method` on CH/ET (unless overridden) """
+    binding = Listener(method=method, **{"channel": CH, "event_type": ET, 
+                                         **kwargs})
+    Bindings.add(binding)
+    return binding
+
+async def drain(ticks:int=3):
+    """ yields to the loop so already scheduled dispatch tasks can run """
+    for _ in range(ticks):
+        await asyncio.sleep(0)
+
+@pytest.fixture(autouse=True)
+def _clear_bindings():
+    Bindings.clear()
+    yield
+
+
 class DummyData(BaseModel):
     content: str
 
@@ -26,7 +73,7 @@ class DummyRelayMessagingSimple(Relay):
     def __init__(self) -> None:
         super().__init__()
         self.emitter_called = False
-        self.listener_called = asyncio.Event()
+        self.listener_called = LazyEvent()
 
     @Relay.listens
     async def listener(self, event:Event[DummyData]):
@@ -42,25 +89,11 @@ class DummyRelayMessagingSimple(Relay):
         return DummyData(content="emitter_1")
 
 async def test_messaging_simple():
-    Bindings.clear()
-
     relay = DummyRelayMessagingSimple()
 
-    # Create a channel and event type for communication
-    channel = "test_channel"
-    event_type = "test_event"
-
-
     # Setting up the binding between emitter and listener
-    emitter_binding = Emitter(method=relay.emitter, 
-                              channel=channel, 
-                              event_type=event_type)
-    listener_binding = Listener(method=relay.listener, 
-                                channel=channel, 
-                                event_type=event_type)
-    
-    Bindings.add(emitter_binding)
-    Bindings.add(listener_binding)
+    bind_emitter(relay.emitter)
+    bind_listener(relay.listener)
 
     # Trigger the emitter
     await relay.emitter()
@@ -92,19 +125,10 @@ class DummyRelayInvalidType(Relay):
         return 123
 
 async def test_invalid_type_emission():
-    Bindings.clear()
-
     relay = DummyRelayInvalidType()
 
-    # Create a channel and event type for communication
-    channel = "test_channel"
-    event_type = "test_event"
-
     # Setting up the binding for emitter
-    emitter_binding = Emitter(method=relay.emitter, 
-                              channel=channel, 
-                              event_type=event_type)
-    Bindings.add(emitter_binding)
+    bind_emitter(relay.emitter)
 
     # Trigger the emitter and expect a TypeError because the return type is wrong
     with pytest.raises(TypeError):
@@ -124,19 +148,10 @@ class DummyRelayNoListener(Relay):
         return DummyData(content="emitter_no_listener")
 
 async def test_emission_without_listeners():
-    Bindings.clear()
-
     relay = DummyRelayNoListener()
 
-    # Create a channel and event type for communication
-    channel = "test_channel"
-    event_type = "test_event"
-
     # Setting up the binding for emitter
-    emitter_binding = Emitter(method=relay.emitter, 
-                              channel=channel, 
-                              event_type=event_type)
-    Bindings.add(emitter_binding)
+    bind_emitter(relay.emitter)
 
     # Trigger the emitter
     await relay.emitter()
@@ -150,8 +165,8 @@ async def test_emission_without_listeners():
 class DummyRelayMultiListener(Relay):
     def __init__(self) -> None:
         super().__init__()
-        self.l1_called = asyncio.Event()
-        self.l2_called = asyncio.Event()
+        self.l1_called = LazyEvent()
+        self.l2_called = LazyEvent()
 
     @Relay.listens
     async def listener1(self, event:Event[DummyData]):
@@ -168,29 +183,12 @@ class DummyRelayMultiListener(Relay):
         return DummyData(content="emitter")
 
 async def test_multiple_listeners():
-    Bindings.clear()
-
     relay = DummyRelayMultiListener()
 
-    # Create a channel and event type for communication
-    channel = "test_channel"
-    event_type = "test_event"
-
     # Setting up the bindings for emitter and listeners
-    emitter_binding = Emitter(method=relay.emitter, 
-                              channel=channel, 
-                              event_type=event_type)
-    listener1_binding = Listener(method=relay.listener1, 
-                                 channel=channel, 
-                                 event_type=event_type)
-    listener2_binding = Listener(method=relay.listener2, 
-                                 channel=channel, 
-                                 event_type=event_type)
-
-    # Add bindings
-    Bindings.add(emitter_binding)
-    Bindings.add(listener1_binding)
-    Bindings.add(listener2_binding)
+    bind_emitter(relay.emitter)
+    bind_listener(relay.listener1)
+    bind_listener(relay.listener2)
     
     # Trigger the emitter
     await relay.emitter()
@@ -209,42 +207,33 @@ class DummyRelayEventOrder(Relay):
     def __init__(self) -> None:
         super().__init__()
         self.results = []
+        self.done = LazyEvent()
 
     @Relay.emits
     async def emitter(self, content: str) -> DummyData:
         # Return the content along with a timestamp
-        return DummyData(content=content + "_" + str(time.time()))
+        # the content is always a str, so there's nothing to validate
+        return DummyData.model_construct(content=f"{content}_{time.time()}")
 
     @Relay.listens
     async def listener(self, event: Event[DummyData]):
         # Record executions
         self.results.append(event.data.content)
+        if len(self.results) == 5:
+            self.done.set()
 
 async def test_event_order():
-    Bindings.clear()
-
     relay = DummyRelayEventOrder()
 
-    # Create a channel and event type for communication
-    channel = "test_channel"
-    event_type = "test_event"
-
     # Setting up the bindings for emitter and listener
-    emitter_binding = Emitter(method=relay.emitter, 
-                              channel=channel, 
-                              event_type=event_type)
-    listener_binding = Listener(method=relay.listener, 
-                                channel=channel, 
-                                event_type=event_type)
-    
-    Bindings.add(emitter_binding)
-    Bindings.add(listener_binding)
+    bind_emitter(relay.emitter)
+    bind_listener(relay.listener)
 
     # Trigger the emitter with series of events
     for i in range(5):
         await relay.emitter(f"event_{i}")
 
-    await asyncio.sleep(0.01)  # Allow event handling to complete
+    await asyncio.wait_for(relay.done.wait(), 1.0)
 
     # Check event processing order
     results = relay.results
@@ -261,6 +250,7 @@ class DummyRelayEventFromSource(Relay):
         super().__init__()
         self.other_results = []
         self.own_results = []
+        self.own_received = LazyEvent()
 
     @Relay.listens
     async def listener(self, event: Event[DummyData]):
@@ -271,6 +261,7 @@ class DummyRelayEventFromSource(Relay):
     async def own_listener(self, event: Event[DummyData]):
         # Record executions
         self.own_results.append(event.data.content)
+        self.own_received.set()
 
     @Relay.emits
     async def emitter(self, content: str) -> DummyData:
@@ -284,51 +275,30 @@ class OtherRelay(Relay):
 
 
 async def test_event_from_specific_source():
-    Bindings.clear()
-
     relay = DummyRelayEventFromSource()
     other_relay = OtherRelay()
 
-    # Create a channel and event type for communication
-    channel = "test_channel"
-    event_type = "test_event"
+    # emitter is not relay, it's other_relay so this shouldn't go through
+    src_other = SourceInfo(relay=relay, emitter=other_relay.other_emitter)
+    # this should go through because emitter is relay
+    src_own = SourceInfo(relay=relay, emitter=relay.emitter)
 
-    # Setting up the bindings for emitter and listener
-    other_emitter_binding = Emitter(method=other_relay.other_emitter, 
-                                    channel=channel, 
-                                    event_type=event_type)
-
-    listener_binding = Listener(method=relay.listener, 
-                                channel=channel, 
-                                event_type=event_type, 
-                                # emitter is not relay, it's other_relay so this shouldn't go through
-                                source=SourceInfo(relay=relay, 
-                                                  emitter=other_relay.other_emitter))
-
-    emitter_binding = Emitter(method=relay.emitter,
-                              channel=channel,
-                              event_type=event_type)
-    own_listener_binding = Listener(method=relay.own_listener,
-                                    channel=channel,
-                                    event_type=event_type,
-                                    # this should go through because emitter is relay
-                                    source=SourceInfo(relay=relay,
-                                                      emitter=relay.emitter))
-    
-    # in these bindings, listener is not expecting source of other_emitter_binding
-    Bindings.add(other_emitter_binding)
-    Bindings.add(listener_binding)
+    # in these bindings, listener is not expecting source of other_emitter
+    bind_emitter(other_relay.other_emitter)
+    bind_listener(relay.listener, source=src_other)
 
-    # in these bindings, listener is expecting source of emitter_binding
-    Bindings.add(emitter_binding)
-    Bindings.add(own_listener_binding)
+    # in these bindings, listener is expecting source of emitter
+    bind_emitter(relay.emitter)
+    bind_listener(relay.own_listener, source=src_own)
 
     
     # Trigger the emitter
     await other_relay.other_emitter("this event should not be received by the listener")
     await relay.emitter("this event should be received by the listener")
 
-    await asyncio.sleep(0.01)  # Allow event handling to complete
+    # other_emitter's event was dispatched first, so by the time own_listener
+    # has run, listener would have too
+    await asyncio.wait_for(relay.own_received.wait(), 1.0)
     
     # Check that the listener did not receive the event
     assert len(relay.other_results) == 0
@@ -341,9 +311,11 @@ async def test_event_from_specific_source():
 # affect other listeners or emitters
 
 class DummyRelayExceptionHandling(Relay):
+    _PAYLOAD = DummyData(content="emitter")
+
     def __init__(self) -> None:
         super().__init__()
-        self.successful_listener_called = asyncio.Event()
+        self.successful_listener_called = LazyEvent()
 
     @Relay.emits
     async def faulty_emitter(self) -> DummyData:
@@ -351,7 +323,7 @@ class DummyRelayExceptionHandling(Relay):
 
     @Relay.emits
     async def successful_emitter(self) -> DummyData:
-        return DummyData(content="emitter")
+        return self._PAYLOAD
 
     @Relay.listens
     async def successful_listener(self, event: Event[DummyData]):
@@ -363,33 +335,13 @@ class DummyRelayExceptionHandling(Relay):
 
 
 async def test_exception_handling():
-    Bindings.clear()
-
     relay = DummyRelayExceptionHandling()
 
-    # Create a channel and event type for communication
-    channel = "test_channel"
-    event_type = "test_event"
-
     # Setting up the bindings for emitters and listeners
-    successful_emitter_binding = Emitter(method=relay.successful_emitter, 
-                                         channel=channel, 
-                                         event_type=event_type)
-    faulty_emitter_binding = Emitter(method=relay.faulty_emitter, 
-                                     channel=channel, 
-                                     event_type=event_type)
-    successful_listener_binding = Listener(method=relay.successful_listener, 
-                                           channel=channel, 
-                                           event_type=event_type)
-    faulty_listener_binding = Listener(method=relay.faulty_listener, 
-                                       channel=channel, 
-                                       event_type=event_type)
-    
-    # Relay.add_binding is the same as Bindings.add
-    Relay.add_binding(successful_emitter_binding)
-    Relay.add_binding(faulty_emitter_binding)
-    Relay.add_binding(successful_listener_binding)
-    Relay.add_binding(faulty_listener_binding)
+    bind_emitter(relay.successful_emitter)
+    bind_emitter(relay.faulty_emitter)
+    bind_listener(relay.successful_listener)
+    bind_listener(relay.faulty_listener)
 
     # Trigger the emitter
     with pytest.raises(Exception, match="This is a faulty emitter"):
@@ -411,9 +363,11 @@ async def test_exception_handling():
 # testing functionality of adding and removing bindings
 
 class DummyRelayBinding(Relay):
+    _PAYLOAD = DummyData(content="emitter")
+
     def __init__(self) -> None:
         super().__init__()
-        self.listener_called = asyncio.Event()
+        self.listener_called = LazyEvent()
 
     @Relay.listens
     async def listener(self, event:Event[DummyData]):
@@ -421,19 +375,16 @@ class DummyRelayBinding(Relay):
 
     @Relay.emits
     async def emitter(self) -> DummyData:
-        return DummyData(content="emitter")
+        return self._PAYLOAD
 
 async def test_add_remove_binding():
-    Bindings.clear()
     relay = DummyRelayBinding()
 
-    # Create a channel and event type for communication
-    channel = "test_channel"
-    event_type = "test_event"
-
-    # Setting up the bindings for emitter and listener
-    emitter_binding = Emitter(method=relay.emitter, channel=channel, event_type=event_type)
-    listener_binding = Listener(method=relay.listener, channel=channel, event_type=event_type)
+    # Setting up the bindings for emitter and listener. Not registered with 
+    # `bind_*` since this test is about Relay.add_binding/remove_binding
+    emitter_binding = Emitter(method=relay.emitter, channel=CH, event_type=ET)
+    listener_binding = Listener(method=relay.listener, channel=CH, 
+                                event_type=ET)
 
     # Adding the bindings
     Relay.add_binding(emitter_binding)
@@ -459,7 +410,7 @@ async def test_add_remove_binding():
     # Trigger the emitter - this time the listener shouldn't be called
     await relay.emitter()
 
-    await asyncio.sleep(0.01)  # just in case, allow event handling to complete
+    await drain()  # just in case, allow event handling to complete
 
     # Check that the listener has not been called
     assert not relay.listener_called.is_set()
@@ -468,9 +419,11 @@ async def test_add_remove_binding():
 # test that NoEmit does not emit anything, but returns data
 
 class DummyRelayNoEmit(Relay):
+    _PAYLOAD = DummyData(content="emitter")
+
     def __init__(self) -> None:
         super().__init__()
-        self.listener_called = asyncio.Event()
+        self.listener_called = LazyEvent()
 
     @Relay.listens
     async def listener(self, event:Event[DummyData]):
@@ -478,28 +431,14 @@ class DummyRelayNoEmit(Relay):
 
     @Relay.emits
     async def emitter(self) -> DummyData:
-        return Relay.NoEmit(data=DummyData(content="emitter"))
+        return Relay.NoEmit(data=self._PAYLOAD)
 
 async def test_no_emit():
-    Bindings.clear()
-
     relay = DummyRelayNoEmit()
 
-    # Create a channel and event type for communication
-    channel = "test_channel"
-    event_type = "test_event"
-
     # Setting up the bindings for emitter and listener
-    emitter_binding = Emitter(method=relay.emitter, 
-                              channel=channel, 
-                              event_type=event_type)
-    listener_binding = Listener(method=relay.listener, 
-                                channel=channel, 
-                                event_type=event_type)
-
-    # Adding the bindings
-    Relay.add_binding(emitter_binding)
-    Relay.add_binding(listener_binding)
+    bind_emitter(relay.emitter)
+    bind_listener(relay.listener)
     
     # Trigger the emitter
     returned_data = await relay.emitter()
@@ -507,8 +446,8 @@ async def test_no_emit():
     # make sure data is still returned
     assert returned_data.content == "emitter"
 
-    # give some sleep time for possible listener execution
-    await asyncio.sleep(0.01)
+    # give possible listener execution a chance to run
+    await drain()
 
     # Check that the listener has NOT been called
     assert not relay.listener_called.is_set()
@@ -534,7 +473,7 @@ will be listened by listener
 class DummyRelayChain(Relay):
     def __init__(self) -> None:
         super().__init__()
-        self.final_listener_called = asyncio.Event()
+        self.final_listener_called = LazyEvent()
 
     @Relay.listens
     async def final_listener(self, event:Event[DummyData]):
@@ -553,31 +492,18 @@ class DummyRelayChain(Relay):
 
 
 async def test_emitter_listener():
-    Bindings.clear()
-
     relay = DummyRelayChain()
 
-    # Create a channel and event type for communication
-    channel = "test_channel"
+    # Two event types, so the chain goes 
+    # starter_emitter -> emitter_listener -> final_listener
     event_type_1 = "test_event_1"
     event_type_2 = "test_event_2"
 
     # Setting up the bindings for the starter_emitter, emitter_listener and final_listener
-    starter_emitter_binding = Emitter(method=relay.starter_emitter, 
-                                      channel=channel, event_type=event_type_1)
-    emitter_listener_listener_binding = Listener(method=relay.emitter_listener, 
-                                                 channel=channel, 
-                                                 event_type=event_type_1)
-    emitter_listener_binding = Emitter(method=relay.emitter_listener, 
-                                       channel=channel, event_type=event_type_2)
-    final_listener_binding = Listener(method=relay.final_listener, 
-                                      channel=channel, event_type=event_type_2)
-
-    # Adding the bindings
-    Relay.add_binding(starter_emitter_binding)
-    Relay.add_binding(emitter_listener_binding)
-    Relay.add_binding(emitter_listener_listener_binding)
-    Relay.add_binding(final_listener_binding)
+    bind_emitter(relay.starter_emitter, event_type=event_type_1)
+    bind_emitter(relay.emitter_listener, event_type=event_type_2)
+    bind_listener(relay.emitter_listener, event_type=event_type_1)
+    bind_listener(relay.final_listener, event_type=event_type_2)
 
     # Trigger the starter_emitter
     await relay.starter_emitter()
@@ -598,29 +524,13 @@ async def test_emitter_listener():
 @pytest.mark.skip(reason=("CAREFUL: Infinite loop catching when methods keep "
                           "calling each other not yet implemented"))
 async def test_emitter_listener_infinite_loop():
-    Bindings.clear()
-
     relay = DummyRelayChain()
 
-    # Create a channel and event type for communication
-    channel = "test_channel"
-    event_type = "test_event"
-
     # Setting up the bindings for the starter_emitter, emitter_listener and final_listener
-    starter_emitter_binding = Emitter(method=relay.starter_emitter, 
-                                      channel=channel, event_type=event_type)
-    emitter_listener_binding = Emitter(method=relay.emitter_listener, 
-                                       channel=channel, event_type=event_type)
-    emitter_listener_listener_binding = Listener(method=relay.emitter_listener, 
-                                                 channel=channel, event_type=event_type)
-    final_listener_binding = Listener(method=relay.final_listener, 
-                                      channel=channel, event_type=event_type)
-
-    # Adding the bindings
-    Relay.add_binding(starter_emitter_binding)
-    Relay.add_binding(emitter_listener_binding)
-    Relay.add_binding(emitter_listener_listener_binding)
-    Relay.add_binding(final_listener_binding)
+    bind_emitter(relay.starter_emitter)
+    bind_emitter(relay.emitter_listener)
+    bind_listener(relay.emitter_listener)
+    bind_listener(relay.final_listener)
 
     # Trigger the starter_emitter
     await relay.starter_emitter()
@@ -631,4 +541,63 @@ async def test_emitter_listener_infinite_loop():
     
     # Assert that the final_data in final_listener matches what is expected
     assert relay.final_data == "emitter_listener: starter_emitter", \
-        f"Expected 'emitter_listener: starter_emitter' but got '{relay.final_data}'"
\ No newline at end of file
+        f"Expected 'emitter_listener: starter_emitter' but got '{relay.final_data}'"
+
+# Listeners with a shared context run in the context of the binding
+
+request_id:contextvars.ContextVar[str] = contextvars.ContextVar("request_id", 
+                                                               default="none")
+
+class DummyRelayContext(Relay):
+    def __init__(self) -> None:
+        super().__init__()
+        self.seen = []
+        self.listener_called = LazyEvent()
+
+    @Relay.listens
+    async def listener(self, event:Event[DummyData]):
+        self.seen.append(request_id.get())
+        self.listener_called.set()
+
+    @Relay.emits
+    async def emitter(self) -> DummyData:
+        return DummyData(content="context")
+
+@pytest.mark.skipif(sys.version_info < (3, 11), 
+                    reason="shared_context requires Python 3.11+")
+@pytest.mark.parametrize("shared_context, expected", [(False, "emit"), 
+                                                      (True, "binding")])
+async def test_listener_shared_context(shared_context, expected):
+    relay = DummyRelayContext()
+
+    token = request_id.set("binding")
+    bind_emitter(relay.emitter)
+    bind_listener(relay.listener, shared_context=shared_context)
+    request_id.reset(token)
+
+    token = request_id.set("emit")
+    await relay.emitter()
+    request_id.reset(token)
+
+    await relay.listener_called.wait()
+    assert relay.seen == [expected]
+
+
+# No event is built for emitters nobody listens to
+
+async def test_emit_without_listeners_builds_no_event(monkeypatch):
+    relay = DummyRelayMessagingSimple()
+    bind_emitter(relay.emitter, channel="nobody_listens")
+
+    built = []
+    unchecked = Event._unchecked
+    monkeypatch.setattr(Event, "_unchecked", classmethod(
+        lambda cls, *args, **kwargs: built.append(kwargs) or 
+                                     unchecked(*args, **kwargs)))
+    assert await relay.emitter() == DummyData(content="emitter_1")
+    assert built == []
+
+    bind_listener(relay.listener, channel="nobody_listens")
+    await relay.emitter()
+    await relay.listener_called.wait()
+    assert len(built) == 1
@@ -4,9 +4,6 @@ from pydantic import BaseModel
 from relay.event import Event, SourceInfo
 from relay.relay import Relay
 
-MAGENTA = "\033[35m"
-RESET = "\033[0m"
-
 
 class DummyData(BaseModel):
     content: str
@@ -28,22 +25,24 @@ class DummyEmitterRelay(Relay):
     async def non_emitter(self) -> DummyData:
         return DummyData(content="Hello")
 
+@pytest.fixture(scope="module")
+def relay_instance():
+    # the tests only call the emitters, so one instance can be shared
+    return DummyEmitterRelay()
+
 
 @pytest.mark.asyncio
-async def test_emits_decorator_valid_return_type():
-    relay_instance = DummyEmitterRelay()
+async def test_emits_decorator_valid_return_type(relay_instance):
     emitted_data = await relay_instance.valid_emitter()
     assert emitted_data.content == "Hello"
 
 
 @pytest.mark.asyncio
-async def test_emits_decorator_invalid_return_type():
-    relay_instance = DummyEmitterRelay()
+async def test_emits_decorator_invalid_return_type(relay_instance):
     with pytest.raises(TypeError, match="Return value: ->") as exc_info:
         await relay_instance.invalid_return_type_emitter()
 
-async def test_emits_decorator_no_emit_return():
-    relay_instance = DummyEmitterRelay()
+async def test_emits_decorator_no_emit_return(relay_instance):
     emitted_data = await relay_instance.no_emit_emitter()
     assert emitted_data.content == "Don't Emit"
     # You might want to add some logic here to ensure the event isn't really emitted.
@@ -3,6 +3,8 @@ import pytest
 from relay.utils import validate_forbidden_characters as validate_chars
 from relay.consts import FORBIDDEN_CHARACTERS
 
+_COMBINED_FORBIDDEN = "".join(FORBIDDEN_CHARACTERS)
+
 def test_make_sure_colon_is_forbidden():
     """ Ensure colon is in the forbidden characters list. """
     assert ":" in FORBIDDEN_CHARACTERS, ("Colon is expected to be forbidden. "
@@ -12,20 +14,19 @@ def test_valid_string():
     """ Ensure no exception for valid strings. """
     assert validate_chars("validString", FORBIDDEN_CHARACTERS) == "validString"
 
-@pytest.mark.parametrize("forbidden_char", FORBIDDEN_CHARACTERS)
-def test_forbidden_characters(forbidden_char):
+def test_forbidden_characters():
     """ Test individual forbidden characters. """
-    with pytest.raises(ValueError, match="Forbidden character") as exc_info:
-        validate_chars(f"This has a {forbidden_char} character",
-                       forbidden_chars=FORBIDDEN_CHARACTERS)
+    for forbidden_char in FORBIDDEN_CHARACTERS:
+        with pytest.raises(ValueError, match="Forbidden character") as exc_info:
+            validate_chars(f"This has a {forbidden_char} character",
+                           forbidden_chars=FORBIDDEN_CHARACTERS)
 
-    assert str(forbidden_char) in str(exc_info.value)
+        assert str(forbidden_char) in str(exc_info.value)
 
 def test_combined_forbidden_characters():
     """ Test a string containing multiple forbidden characters. """
-    test_string = "".join(FORBIDDEN_CHARACTERS)
     with pytest.raises(ValueError, match="Forbidden character"):
-        validate_chars(test_string, forbidden_chars=FORBIDDEN_CHARACTERS)
+        validate_chars(_COMBINED_FORBIDDEN, forbidden_chars=FORBIDDEN_CHARACTERS)
 
 def test_non_string_input():
     """ Ensure the function works with non-string inputs. """
@@ -38,3 +39,25 @@ def test_non_string_input():
     with pytest.raises(ValueError, match="Forbidden character"):
         validate_chars(number_with_forbidden, 
                        forbidden_chars=FORBIDDEN_CHARACTERS)
+
+def test_custom_forbidden_characters():
+    """ Forbidden entries other than FORBIDDEN_CHARACTERS, incl. substrings. """
+    assert validate_chars("a:b", forbidden_chars=["::", "#"]) == "a:b"
+    for value in ("a::b", "a#b"):
+        with pytest.raises(ValueError, match="Forbidden character"):
+            validate_chars(value, forbidden_chars=["::", "#"])
+
+def test_reports_first_forbidden_character_in_list_order():
+    """ The message names the first entry of `forbidden_chars` found. """
+    with pytest.raises(ValueError, match="Forbidden character '#'"):
+        validate_chars("x:#", forbidden_chars=["#", ":"])
+
+def test_forbidden_characters_changes_are_picked_up():
+    """ Entries added to FORBIDDEN_CHARACTERS are enforced right away. """
+    assert validate_chars("a#b", FORBIDDEN_CHARACTERS) == "a#b"
+    FORBIDDEN_CHARACTERS.append("#")
+    try:
+        with pytest.raises(ValueError, match="Forbidden character '#'"):
+            validate_chars("a#b", FORBIDDEN_CHARACTERS)
+    finally:
+        FORBIDDEN_CHARACTERS.remove("#")
@@ -0,0 +1,48 @@
+import pytest
+
+import gc
+import weakref
+from pydantic import BaseModel
+from typing import Any, List, Literal, Optional, Union
+from relay.utils import isinstance_types, type_check
+
+class Bob(BaseModel):
+    name: str
+
+@pytest.mark.parametrize("type_hint, expected", [
+    (int, (int,)),
+    (Bob, (Bob,)),
+    (None, (type(None),)),
+    (int|str, (int, str)),
+    (Union[int, Bob], (int, Bob)),
+    (Optional[str], (str, type(None))),
+    (Any, None),
+    (List[int], None),
+    (list[int], None),
+    (Literal[1, 2], None),
+    (Union[int, List[int]], None),
+])
+def test_isinstance_types(type_hint, expected):
+    assert isinstance_types(type_hint) == expected
+
+@pytest.mark.parametrize("type_hint", [int, Bob, None, int|str, Optional[Bob]])
+@pytest.mark.parametrize("value", [5, "hello", None, Bob(name="Bob"), 5.0])
+def test_isinstance_types_agrees_with_type_check(value, type_hint):
+    accepts = isinstance_types(type_hint)
+    assert isinstance(value, accepts) == type_check(value, type_hint)
+
+def test_type_check_with_unhashable_hint():
+    assert type_check([1, 2], Literal[[1, 2]])
+    assert not type_check([1], Literal[[1, 2]])
+
+def test_type_check_does_not_keep_local_classes_alive():
+    def check_local_class():
+        class Local:
+            pass
+        assert type_check(Local(), Local) and type_check(Local(), Local|int)
+        assert type_check([Local()], list[Local])
+        return weakref.ref(Local)
+
+    local_ref = check_local_class()
+    gc.collect()
+    assert local_ref() is None
@@ -1,40 +1,23 @@
 import pytest
 from relay.utils import truncate
 
-def test_basic_truncation():
-    """Test basic string truncation."""
-    data = "This is a long string that needs truncation."
-    result = truncate(data, 20)
-    assert result == "This is a long st..."
-
-def test_truncation_with_braces():
-    """Test truncation when data starts with an opening brace."""
-    data = "{key: value, another_key: another_value}"
-    result = truncate(data, 20)
-    assert result == "{key: value, ano...}"
-
-def test_no_truncation_needed():
-    """Test string that doesn't require truncation."""
-    data = "Short string"
-    result = truncate(data, 20)
-    assert result == "Short string"
-
-def test_default_truncation_length():
-    """Test default truncation length."""
-    data = "A string that will be truncated at the default length."
-    result = truncate(data)
-    assert result == "A string that wil..."
-
-def test_truncation_with_different_data_types():
-    """Test truncation with various data types."""
-    integer_data = 123456789012345678901
-    result = truncate(integer_data)
-    assert result == "12345678901234567..."
-    
-    list_data = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-    result = truncate(list_data, 15)
-    assert result == "[1, 2, 3, 4...]"
-
-    tuple_data = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
-    result = truncate(tuple_data, 15)
-    assert result == "(1, 2, 3, 4...)"
+@pytest.mark.parametrize("data, length, expected", [
+    # basic string truncation
+    ("This is a long string that needs truncation.", 20, 
+     "This is a long st..."),
+    # data starts with an opening brace
+    ("{key: value, another_key: another_value}", 20, "{key: value, ano...}"),
+    # no truncation needed
+    ("Short string", 20, "Short string"),
+    # default truncation length
+    ("A string that will be truncated at the default length.", None, 
+     "A string that wil..."),
+    # various data types
+    (123456789012345678901, None, "12345678901234567..."),
+    ([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 15, "[1, 2, 3, 4...]"),
+    ((1, 2, 3, 4, 5, 6, 7, 8, 9, 10), 15, "(1, 2, 3, 4...)"),
+])
+def test_truncate(data, length, expected):
+    """ Test truncation, `length` of None uses the default length. """
+    result = truncate(data) if length is None else truncate(data, length)
+    assert result == expected
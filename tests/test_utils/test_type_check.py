@@ -4,8 +4,8 @@ from pydantic import BaseModel, ValidationError
 from typing import Callable, Dict, List, Literal, Set, Tuple, Union
 from relay.utils import type_check
 
-# Test for Basic Types and User-Defined Classes
-@pytest.mark.parametrize("value, type_hint, expected", [
+# Basic Types
+BASIC_CASES = [
     (5, int, True),
     ("hello", str, True),
     (5.0, float, True),
@@ -15,9 +15,7 @@ from relay.utils import type_check
     (None, int, False),
     (5, None, False),
     (None, None, True),
-])
-def test_basic_types(value, type_hint, expected):
-    assert type_check(value, type_hint) == expected
+]
 
 class User:
     def __init__(self, name):
@@ -26,15 +24,14 @@ class User:
 class Bob(BaseModel):
     name: str
 
-@pytest.mark.parametrize("value, type_hint, expected", [
+# User-Defined Classes
+USER_CLASS_CASES = [
     (User("Alice"), User, True),
     ("Alice", User, False),
     (Bob(name="Bob"), Bob, True),
     ("Bob", Bob, False),
     (Bob(name="Bob"), None, False),
-])
-def test_user_defined_classes(value, type_hint, expected):
-    assert type_check(value, type_hint) == expected
+]
 
 # Define a Pydantic model for testing
 class Item(BaseModel):
@@ -54,8 +51,8 @@ def test_pydantic_base_model(value, type_hint, expected):
     except ValidationError:
         assert not expected
 
-# Test for Typing Constructs - List, Tuple, Set, Dict
-@pytest.mark.parametrize("value, type_hint, expected", [
+# Typing Constructs - List, Tuple, Set, Dict
+TYPING_CONSTRUCT_CASES = [
     ([], list, True),
     ((), tuple, True),
     ([], list[int], True),
@@ -93,13 +90,10 @@ def test_pydantic_base_model(value, type_hint, expected):
     ({"a": 1, "b": "2"}, Dict[str, int], False),
     ({"a": 1, 2: "b"}, dict[int|str, int|str], True),
     ({"a": 1, 2: "b"}, Dict[Union[int, str], Union[int, str]], True)
-])
-def test_typing_constructs(value, type_hint, expected):
-    type_check(value, type_hint) == expected
-    assert type_check(value, type_hint) == expected
+]
 
-# Test for Typing Constructs - Union, Literal, Callable
-@pytest.mark.parametrize("value, type_hint, expected", [
+# Typing Constructs - Union, Literal, Callable
+UNION_LITERAL_CALLABLE_CASES = [
     (1, Union[int, str], True),
     (1, int|str, True),
     ("hello", Union[int, str], True),
@@ -108,10 +102,22 @@ def test_typing_constructs(value, type_hint, expected):
     ("cherry", Literal["apple", "banana"], False),
     (lambda x: x+1, Callable, True),
     ("not_callable", Callable, False),
-])
-def test_union_literal_callable(value, type_hint, expected):
+]
+
+TYPE_CHECK_CASES = [*BASIC_CASES, *USER_CLASS_CASES, *TYPING_CONSTRUCT_CASES, 
+                    *UNION_LITERAL_CALLABLE_CASES]
+
+@pytest.mark.parametrize("value, type_hint, expected", TYPE_CHECK_CASES, 
+                         ids=lambda param: repr(param)[:40])
+def test_type_check_table(value, type_hint, expected):
     assert type_check(value, type_hint) == expected
 
+def test_type_check_honours_class_override():
+    """ like isinstance, a value's `__class__` counts, not just its type """
+    class IntProxy:
+        __class__ = int
+    assert type_check(IntProxy(), int)
+
 # Test for Errors - ValidationError, TypeError, NotImplementedError
 def test_error_cases():
 
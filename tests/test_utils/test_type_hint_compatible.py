@@ -31,155 +31,156 @@ class House(Building):
 
 
 # Pytest for type_hint_compatible:
-# skip
-@pytest.mark.skip(reason="Not implemented/used yet.")
-def test_type_hint_compatible():
+
+COMPAT_CASES = [
     # Basic compatibility tests
-    assert type_hint_compatible(int, int)
-    assert not type_hint_compatible(int, str)
+    (int, int, True),
+    (int, str, False),
 
-    assert type_hint_compatible(int, int|str)
-    assert type_hint_compatible(int|str, int)
-    assert type_hint_compatible(int, Union[int, str])
-    assert type_hint_compatible(Union[int, str], int)
+    (int, int|str, True),
+    (int|str, int, True),
+    (int, Union[int, str], True),
+    (Union[int, str], int, True),
 
-    assert type_hint_compatible(int|str, int|str|float)
-    assert type_hint_compatible(int|str|float, int|str)
-    assert type_hint_compatible(Union[int, str], Union[int, str, float])
-    assert type_hint_compatible(Union[int, str, float], Union[int, str])
+    (int|str, int|str|float, True),
+    (int|str|float, int|str, True),
+    (Union[int, str], Union[int, str, float], True),
+    (Union[int, str, float], Union[int, str], True),
 
-    assert type_hint_compatible(int|float, int|str)
-    assert type_hint_compatible(int|str, int|float)
-    assert type_hint_compatible(Union[int, float], Union[int, str])
-    assert type_hint_compatible(Union[int, str], Union[int, float])
+    (int|float, int|str, True),
+    (int|str, int|float, True),
+    (Union[int, float], Union[int, str], True),
+    (Union[int, str], Union[int, float], True),
 
-    assert not type_hint_compatible(int|float, str|dict)
-    assert not type_hint_compatible(str|dict, int|float)
-    assert not type_hint_compatible(Union[int, float], Union[str, dict])
-    assert not type_hint_compatible(Union[str, dict], Union[int, float])
+    (int|float, str|dict, False),
+    (str|dict, int|float, False),
+    (Union[int, float], Union[str, dict], False),
+    (Union[str, dict], Union[int, float], False),
 
     # Nested types
-    assert type_hint_compatible(list[int], list)
-    assert type_hint_compatible(list, list[int])
-    assert type_hint_compatible(List[int], list)
-    assert type_hint_compatible(list, List[int])
-    assert type_hint_compatible(List[int], List)
-    assert type_hint_compatible(List, List[int])
-    assert not type_hint_compatible(list[int], list[str])
-    assert not type_hint_compatible(list[str], list[int])
-    assert not type_hint_compatible(list[int|str], list[float|bool])
-
-    assert type_hint_compatible(list[int], list[int]|str)
-    assert type_hint_compatible(list[int]|str, list[int])
-    assert type_hint_compatible(List[int], list[int]|str)
-    assert type_hint_compatible(list[int]|str, List[int])
-    assert type_hint_compatible(List[int], List[int]|str)
-    assert type_hint_compatible(List[int]|str, List[int])
-    assert type_hint_compatible(list[int], Union[list[int], str])
-    assert type_hint_compatible(Union[list[int], str], list[int])
-    assert type_hint_compatible(list[int, str, int], list)
-    assert not type_hint_compatible(list[int, str, int], list[str, int, str])
-    assert not type_hint_compatible(list[int, str, int], list[int, str])
-    assert not type_hint_compatible(list[int], list[str]|str|set|list[set])
-    assert not type_hint_compatible(list[int], Union[list[str], str])
-
-    assert type_hint_compatible(tuple[int], tuple)
-    assert type_hint_compatible(tuple, tuple[int])
-    assert type_hint_compatible(Tuple[int], tuple)
-    assert type_hint_compatible(tuple, Tuple[int])
-    assert type_hint_compatible(tuple[int, str], tuple)
-    assert type_hint_compatible(tuple, tuple[int, str])
-    assert type_hint_compatible(Tuple[int, str], tuple)
-    assert type_hint_compatible(tuple, Tuple[int, str])
-    assert not type_hint_compatible(tuple[int, str], tuple[str, int])
-    assert not type_hint_compatible(tuple[str, int], tuple[int, str])
-    assert not type_hint_compatible(tuple[int, str], tuple[int, str, int])
-    assert not type_hint_compatible(tuple[int, str, int], tuple[int, str])
-
-    assert type_hint_compatible(dict[str, int], dict)
-    assert type_hint_compatible(dict, dict[str, int])
-    assert type_hint_compatible(Dict[str, int], Dict)
-    assert type_hint_compatible(Dict, Dict[str, int])
-    assert type_hint_compatible(dict[str, int], dict[str, int]|str)
-    assert type_hint_compatible(dict[str, dict], dict[str, dict[str, int]])
-    assert type_hint_compatible(dict[str, dict[str, int]], dict[str, dict])
-    assert not type_hint_compatible(dict[str, int], dict[str, str])
-    assert not type_hint_compatible(dict[str, dict[str, int]], 
-                                    dict[str, dict[str, str]])
-
-    assert type_hint_compatible(set[int], set)
-    assert type_hint_compatible(set, set[int])
-    assert type_hint_compatible(Set[int], Set)
-    assert type_hint_compatible(Set, Set[int])
-    assert type_hint_compatible(set[int], Set)
-    assert type_hint_compatible(set[int|str], set)
-    assert type_hint_compatible(set[int|str], Set)
-    assert type_hint_compatible(Set[int|str], set)
-    assert type_hint_compatible(Set[int|str], Set)
-    assert not type_hint_compatible(set[int], set[str])
+    (list[int], list, True),
+    (list, list[int], True),
+    (List[int], list, True),
+    (list, List[int], True),
+    (List[int], List, True),
+    (List, List[int], True),
+    (list[int], list[str], False),
+    (list[str], list[int], False),
+    (list[int|str], list[float|bool], False),
+
+    (list[int], list[int]|str, True),
+    (list[int]|str, list[int], True),
+    (List[int], list[int]|str, True),
+    (list[int]|str, List[int], True),
+    (List[int], List[int]|str, True),
+    (List[int]|str, List[int], True),
+    (list[int], Union[list[int], str], True),
+    (Union[list[int], str], list[int], True),
+    (list[int, str, int], list, True),
+    (list[int, str, int], list[str, int, str], False),
+    (list[int, str, int], list[int, str], False),
+    (list[int], list[str]|str|set|list[set], False),
+    (list[int], Union[list[str], str], False),
+
+    (tuple[int], tuple, True),
+    (tuple, tuple[int], True),
+    (Tuple[int], tuple, True),
+    (tuple, Tuple[int], True),
+    (tuple[int, str], tuple, True),
+    (tuple, tuple[int, str], True),
+    (Tuple[int, str], tuple, True),
+    (tuple, Tuple[int, str], True),
+    (tuple[int, str], tuple[str, int], False),
+    (tuple[str, int], tuple[int, str], False),
+    (tuple[int, str], tuple[int, str, int], False),
+    (tuple[int, str, int], tuple[int, str], False),
+
+    (dict[str, int], dict, True),
+    (dict, dict[str, int], True),
+    (Dict[str, int], Dict, True),
+    (Dict, Dict[str, int], True),
+    (dict[str, int], dict[str, int]|str, True),
+    (dict[str, dict], dict[str, dict[str, int]], True),
+    (dict[str, dict[str, int]], dict[str, dict], True),
+    (dict[str, int], dict[str, str], False),
+    (dict[str, dict[str, int]], dict[str, dict[str, str]], False),
+
+    (set[int], set, True),
+    (set, set[int], True),
+    (Set[int], Set, True),
+    (Set, Set[int], True),
+    (set[int], Set, True),
+    (set[int|str], set, True),
+    (set[int|str], Set, True),
+    (Set[int|str], set, True),
+    (Set[int|str], Set, True),
+    (set[int], set[str], False),
 
     # Any
-    assert type_hint_compatible(Any, int)
-    assert type_hint_compatible(int, Any)
-    assert type_hint_compatible(Any, Any)
-    assert type_hint_compatible(list[Any], list[str])
-    assert type_hint_compatible(dict[str, Any], dict[str, int])
-    assert not type_hint_compatible(list[Any], dict[str, dict])
+    (Any, int, True),
+    (int, Any, True),
+    (Any, Any, True),
+    (list[Any], list[str], True),
+    (dict[str, Any], dict[str, int], True),
+    (list[Any], dict[str, dict], False),
 
     # Pydantic BaseModel subclasses
-    assert type_hint_compatible(Person, Person)
-    assert type_hint_compatible(Employee, Person)
-    assert type_hint_compatible(Student, Person)
-    assert type_hint_compatible(Person, Employee)
-    assert type_hint_compatible(Person, Student)
-    assert not type_hint_compatible(Employee, Student)
-    assert not type_hint_compatible(Student, Employee)
-    assert not type_hint_compatible(Person, Animal)
-    assert not type_hint_compatible(Animal, Person)
-    assert not type_hint_compatible(Employee, Animal)
-    assert not type_hint_compatible(Animal, Employee)
-
-    assert type_hint_compatible(Person|Animal, Person)
-    assert type_hint_compatible(Person, Person|Animal)
-    assert type_hint_compatible(Person|Animal, Employee)
-
-    assert type_hint_compatible(list[Person], list)
-    assert type_hint_compatible(list, list[Person])
-    assert type_hint_compatible(List[Person], list)
-    assert type_hint_compatible(list, List[Person])
-    assert type_hint_compatible(List[Person], List)
-    assert type_hint_compatible(List, List[Person])
-    assert type_hint_compatible(list[Person], list[Employee])
-    assert type_hint_compatible(list[Person], list[Student])
-    assert type_hint_compatible(list[Employee], list[Person])
-    assert type_hint_compatible(list[Student], list[Person])
-    assert not type_hint_compatible(list[Employee], list[Student])
-    assert not type_hint_compatible(list[Student], list[Employee])
-    assert not type_hint_compatible(list[Person], list[Animal])
-    assert not type_hint_compatible(list[Animal], list[Person])
-
-    assert type_hint_compatible(list[dict[str, Person]], list)
-    assert type_hint_compatible(list, list[dict[str, Person]])
-    assert type_hint_compatible(list[dict[str, Person]], list[dict])
-    assert type_hint_compatible(list[dict[str, Any]], list[dict[str, Person]])
+    (Person, Person, True),
+    (Employee, Person, True),
+    (Student, Person, True),
+    (Person, Employee, True),
+    (Person, Student, True),
+    (Employee, Student, False),
+    (Student, Employee, False),
+    (Person, Animal, False),
+    (Animal, Person, False),
+    (Employee, Animal, False),
+    (Animal, Employee, False),
+
+    (Person|Animal, Person, True),
+    (Person, Person|Animal, True),
+    (Person|Animal, Employee, True),
+
+    (list[Person], list, True),
+    (list, list[Person], True),
+    (List[Person], list, True),
+    (list, List[Person], True),
+    (List[Person], List, True),
+    (List, List[Person], True),
+    (list[Person], list[Employee], True),
+    (list[Person], list[Student], True),
+    (list[Employee], list[Person], True),
+    (list[Student], list[Person], True),
+    (list[Employee], list[Student], False),
+    (list[Student], list[Employee], False),
+    (list[Person], list[Animal], False),
+    (list[Animal], list[Person], False),
+
+    (list[dict[str, Person]], list, True),
+    (list, list[dict[str, Person]], True),
+    (list[dict[str, Person]], list[dict], True),
+    (list[dict[str, Any]], list[dict[str, Person]], True),
 
     # User-defined classes
-    assert type_hint_compatible(Building, Building)
-    assert type_hint_compatible(School, Building)
-    assert type_hint_compatible(House, Building)
-    assert type_hint_compatible(Building, School)
-    assert type_hint_compatible(Building, House)
-    assert not type_hint_compatible(School, House)
-    assert not type_hint_compatible(House, School)
-    assert not type_hint_compatible(Building, Animal)
-    assert not type_hint_compatible(Animal, Building)
-    assert not type_hint_compatible(School, Animal)
-    assert not type_hint_compatible(Animal, School)
-
-    assert type_hint_compatible(list[Building], list)
-    assert type_hint_compatible(list, list[Building])
-    assert type_hint_compatible(set[Building], set[Animal]|set[Person|Any])
-
-
+    (Building, Building, True),
+    (School, Building, True),
+    (House, Building, True),
+    (Building, School, True),
+    (Building, House, True),
+    (School, House, False),
+    (House, School, False),
+    (Building, Animal, False),
+    (Animal, Building, False),
+    (School, Animal, False),
+    (Animal, School, False),
+
+    (list[Building], list, True),
+    (list, list[Building], True),
+    (set[Building], set[Animal]|set[Person|Any], True),
+]
 
 
+@pytest.mark.skip(reason="Not implemented/used yet.")
+@pytest.mark.parametrize("type_hint_1, type_hint_2, expected", COMPAT_CASES)
+def test_type_hint_compatible(type_hint_1, type_hint_2, expected):
+    assert type_hint_compatible(type_hint_1, type_hint_2) is expected